@@ -16,9 +16,21 @@ __version__ = "1.0.0"
 __author__ = "Debai Team"
 __license__ = "GPL-3.0-or-later"
 
-from debai.core.agent import Agent, AgentConfig, AgentManager
-from debai.core.model import Model, ModelConfig, ModelManager
-from debai.core.task import Task, TaskConfig, TaskManager
+from typing import Any
+
+# Public classes are resolved on first access so that lightweight entry points
+# (e.g. ``debai --help``) do not pay for importing pydantic, yaml and psutil.
+_LAZY_EXPORTS = {
+    "Agent": "debai.core.agent",
+    "AgentConfig": "debai.core.agent",
+    "AgentManager": "debai.core.agent",
+    "Model": "debai.core.model",
+    "ModelConfig": "debai.core.model",
+    "ModelManager": "debai.core.model",
+    "Task": "debai.core.task",
+    "TaskConfig": "debai.core.task",
+    "TaskManager": "debai.core.task",
+}
 
 __all__ = [
     "__version__",
@@ -34,3 +46,14 @@ __all__ = [
     "TaskConfig",
     "TaskManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,6 @@
+"""
+Subcommands for the Debai CLI.
+
+Each module defines one top-level command or group, loaded on demand by
+debai.cli.main.LazyGroup.
+"""
@@ -0,0 +1,346 @@
+"""
+Agent management commands for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+from debai.cli.helpers import (
+    AgentParam,
+    emit,
+    get_console,
+    get_agent_manager,
+    run_async,
+    run_batch,
+    spinner,
+    unique_agents,
+    in_daemon_thread,
+)
+
+if TYPE_CHECKING:
+    from debai.core.agent import Agent
+
+# Choice values mirror debai.core.agent.AgentType; they are spelled out here
+# to avoid importing the core models at decoration time.
+AGENT_TYPE_CHOICES = (
+    "system", "package", "config", "resource", "security", "backup", "network", "custom",
+)
+
+# Rich markup for status values shown in listings
+_AGENT_STATUS_ICONS = {
+    "stopped": "[dim]● Stopped[/dim]",
+    "running": "[green]● Running[/green]",
+    "error": "[red]● Error[/red]",
+    "waiting": "[yellow]● Waiting[/yellow]",
+}
+
+
+@click.group()
+def agent() -> None:
+    """Manage AI agents."""
+    pass
+
+
+@agent.command("list")
+@click.option("-s", "--status", type=click.Choice(["running", "stopped", "all"]), default="all")
+@click.pass_context
+def agent_list(ctx: click.Context, status: str) -> None:
+    """List all agents."""
+    from rich import box
+    from rich.table import Table
+    from debai.core.agent import AgentStatus
+    
+    console = get_console()
+    manager = get_agent_manager()
+    
+    agents = manager.list_agents(status=None if status == "all" else AgentStatus(status))
+    
+    if not agents:
+        if status != "all":
+            console.print(f"[yellow]No {status} agents found[/yellow]")
+        else:
+            console.print("[yellow]No agents found. Create one with 'debai agent create'[/yellow]")
+        return
+    
+    table = Table(
+        title="[bold]AI Agents[/bold]",
+        box=box.ROUNDED,
+        show_header=True,
+        padding=(0, 1),
+    )
+    table.add_column("ID", style="cyan")
+    table.add_column("Name")
+    table.add_column("Type")
+    table.add_column("Status")
+    table.add_column("Model")
+    table.add_column("Interactive")
+    
+    rows = [
+        (
+            a.id,
+            a.name,
+            a.config.agent_type,
+            _AGENT_STATUS_ICONS.get(a.status.value, a.status.value),
+            a.config.model_id,
+            "✓" if a.config.interactive else "✗",
+        )
+        for a in agents
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(table)
+
+
+@agent.command("create")
+@click.option("-n", "--name", prompt="Agent name", help="Name for the agent")
+@click.option("-t", "--type", "agent_type", 
+              type=click.Choice(AGENT_TYPE_CHOICES),
+              default="custom", help="Agent type")
+@click.option("-m", "--model", default="llama3.2:3b", help="Model to use")
+@click.option("--template", help="Use a predefined template")
+@click.option("--interactive/--no-interactive", default=True, help="Allow user interaction")
+@click.pass_context
+def agent_create(
+    ctx: click.Context,
+    name: str,
+    agent_type: str,
+    model: str,
+    template: Optional[str],
+    interactive: bool,
+) -> None:
+    """Create a new agent."""
+    from debai.core.agent import (
+        AgentConfig, AgentManager, AgentType, get_agent_template, list_agent_templates,
+    )
+    
+    if template:
+        config = get_agent_template(template)
+        if not config:
+            emit(
+                f"[red]Template '{template}' not found[/red]",
+                f"Available templates: {', '.join(list_agent_templates())}",
+            )
+            return
+        config.name = name
+        config.model_id = model
+    else:
+        config = AgentConfig(
+            name=name,
+            agent_type=AgentType(agent_type),
+            model_id=model,
+            interactive=interactive,
+        )
+    
+    manager = AgentManager()
+    
+    async def create():
+        agent = await manager.create_agent(config)
+        return agent
+    
+    with spinner("Creating agent..."):
+        agent = run_async(create())
+    
+    emit(
+        f"\n[green]✓ Agent created successfully![/green]",
+        f"  ID: [cyan]{agent.id}[/cyan]",
+        f"  Name: {agent.name}",
+        f"  Type: {agent.config.agent_type}",
+        f"  Model: {agent.config.model_id}",
+        f"\nStart with: [bold]debai agent start {agent.id}[/bold]",
+    )
+
+
+@agent.command("start")
+@click.argument("agents", metavar="[AGENT_ID]...", type=AgentParam(), nargs=-1)
+@click.option("--all", "all_agents", is_flag=True, help="Start every configured agent")
+@click.option("--concurrency", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Maximum number of agents started at once")
+@click.pass_context
+def agent_start(
+    ctx: click.Context,
+    agents: tuple[Agent, ...],
+    all_agents: bool,
+    concurrency: int,
+) -> None:
+    """Start one or more agents."""
+    manager = get_agent_manager()
+    
+    if all_agents:
+        agents = manager.list_agents()
+    elif agents:
+        agents = unique_agents(agents)
+    else:
+        raise click.UsageError("Specify at least one AGENT_ID or use --all")
+    
+    results = run_batch(
+        agents,
+        lambda agent: f"Starting agent '{agent.name}'...",
+        lambda agent: agent.start(),
+        concurrency,
+    )
+    
+    emit(*(
+        f"[green]✓ Agent '{agent.name}' started[/green]" if success
+        else f"[red]✗ Failed to start agent '{agent.name}'[/red]"
+        for agent, success in zip(agents, results)
+    ))
+
+
+@agent.command("stop")
+@click.argument("agents", metavar="[AGENT_ID]...", type=AgentParam(), nargs=-1)
+@click.option("--all", "all_agents", is_flag=True, help="Stop every running agent")
+@click.option("--concurrency", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Maximum number of agents stopped at once")
+@click.pass_context
+def agent_stop(
+    ctx: click.Context,
+    agents: tuple[Agent, ...],
+    all_agents: bool,
+    concurrency: int,
+) -> None:
+    """Stop one or more agents."""
+    from debai.core.agent import AgentStatus
+    
+    manager = get_agent_manager()
+    
+    if all_agents:
+        agents = manager.list_agents(status=AgentStatus.RUNNING)
+    elif agents:
+        agents = unique_agents(agents)
+    else:
+        raise click.UsageError("Specify at least one AGENT_ID or use --all")
+    
+    results = run_batch(
+        agents,
+        lambda agent: f"Stopping agent '{agent.name}'...",
+        lambda agent: agent.stop(),
+        concurrency,
+    )
+    
+    emit(*(
+        f"[green]✓ Agent '{agent.name}' stopped[/green]" if success
+        else f"[red]✗ Failed to stop agent '{agent.name}'[/red]"
+        for agent, success in zip(agents, results)
+    ))
+
+
+@agent.command("delete")
+@click.argument("agents", metavar="AGENT_ID...", type=AgentParam(), nargs=-1, required=True)
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@click.option("--concurrency", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Maximum number of agents deleted at once")
+@click.pass_context
+def agent_delete(
+    ctx: click.Context,
+    agents: tuple[Agent, ...],
+    force: bool,
+    concurrency: int,
+) -> None:
+    """Delete one or more agents."""
+    manager = get_agent_manager()
+    agents = unique_agents(agents)
+    
+    if not force:
+        names = ", ".join(f"'{agent.name}'" for agent in agents)
+        noun = "agent" if len(agents) == 1 else "agents"
+        if not click.confirm(f"Delete {noun} {names}?", default=False):
+            return
+    
+    results = run_batch(
+        agents,
+        lambda agent: f"Deleting agent '{agent.name}'...",
+        lambda agent: manager.delete_agent(agent.id),
+        concurrency,
+    )
+    
+    emit(*(
+        f"[green]✓ Agent '{agent.name}' deleted[/green]" if success
+        else f"[red]✗ Failed to delete agent '{agent.name}'[/red]"
+        for agent, success in zip(agents, results)
+    ))
+
+
+@agent.command("chat")
+@click.argument("agent", metavar="AGENT_ID", type=AgentParam())
+@click.pass_context
+def agent_chat(ctx: click.Context, agent: Agent) -> None:
+    """Start an interactive chat session with an agent."""
+    from rich.panel import Panel
+    
+    console = get_console()
+    
+    console.print(Panel(
+        f"[bold]Chat with {agent.name}[/bold]\n\n"
+        f"Type your message and press Enter.\n"
+        f"Type 'exit' or 'quit' to end the session.",
+        title="Agent Chat",
+        border_style="cyan",
+    ))
+    
+    prompt = click.style("\nYou", fg="cyan", bold=True)
+    
+    async def chat_session():
+        await agent.start()
+        
+        try:
+            while True:
+                try:
+                    user_input = await in_daemon_thread(
+                        lambda: click.prompt(prompt, default="", show_default=False)
+                    )
+                except (EOFError, click.Abort):
+                    break
+                
+                if user_input.lower() in ("exit", "quit", "q"):
+                    break
+                
+                replied = False
+                async for chunk in agent.stream_message(user_input):
+                    if not replied:
+                        console.print(f"\n[bold green]{agent.name}[/bold green]: ", end="")
+                        replied = True
+                    console.print(chunk, end="", markup=False, highlight=False)
+                
+                if not replied:
+                    console.print("[yellow]No response from agent[/yellow]")
+        finally:
+            await agent.stop()
+    
+    try:
+        run_async(chat_session())
+    except KeyboardInterrupt:
+        pass
+    console.print("\n[dim]Chat session ended[/dim]")
+
+
+@agent.command("templates")
+def agent_templates() -> None:
+    """List available agent templates."""
+    from rich import box
+    from rich.table import Table
+    from debai.core.agent import list_agent_templates_with_configs
+    
+    table = Table(
+        title="[bold]Agent Templates[/bold]",
+        box=box.ROUNDED,
+        show_header=True,
+    )
+    table.add_column("Template")
+    table.add_column("Description")
+    table.add_column("Type")
+    
+    rows = [
+        (name, config.description, config.agent_type)
+        for name, config in list_agent_templates_with_configs()
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    emit(
+        table,
+        "\nUse with: [bold]debai agent create --template <name>[/bold]",
+    )
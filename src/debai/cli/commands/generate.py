@@ -0,0 +1,132 @@
+"""
+Image and configuration generation commands for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+import click
+
+from debai.cli.helpers import emit, get_console, run_async, spinner
+
+
+@click.group()
+def generate() -> None:
+    """Generate distribution images and configurations."""
+    pass
+
+
+@generate.command("iso")
+@click.option("-o", "--output", type=click.Path(dir_okay=False),
+              default="debai.iso", help="Output ISO file path")
+@click.option("--base", default="debian", help="Base distribution")
+@click.option("--include-agents", is_flag=True, help="Include configured agents")
+@click.pass_context
+def generate_iso(ctx: click.Context, output: str, base: str, include_agents: bool) -> None:
+    """Generate a bootable ISO image."""
+    from rich.panel import Panel
+    from debai.generators.iso import ISOGenerator
+    
+    console = get_console()
+    
+    console.print(Panel(
+        f"[bold]Generating ISO Image[/bold]\n\n"
+        f"Output: {output}\n"
+        f"Base: {base}\n"
+        f"Include agents: {include_agents}",
+        title="ISO Generation",
+        border_style="cyan",
+    ))
+    
+    generator = ISOGenerator(
+        output_path=output,
+        base_distro=base,
+        include_agents=include_agents,
+    )
+    
+    async def gen():
+        return await generator.generate()
+    
+    with spinner("Generating ISO..."):
+        result = run_async(gen())
+    
+    if result["success"]:
+        emit(
+            f"\n[green]✓ ISO generated: {output}[/green]",
+            f"  Size: {result['size_mb']:.1f} MB",
+        )
+    else:
+        console.print(f"\n[red]✗ Failed to generate ISO[/red]")
+        if result.get("error"):
+            console.print(f"  Error: {result['error']}")
+
+
+@generate.command("qcow2")
+@click.option("-o", "--output", type=click.Path(dir_okay=False),
+              default="debai.qcow2", help="Output QCOW2 file path")
+@click.option("--size", default="20G", help="Disk size")
+@click.option("--base", default="debian", help="Base distribution")
+@click.pass_context
+def generate_qcow2(ctx: click.Context, output: str, size: str, base: str) -> None:
+    """Generate a QCOW2 image for QEMU."""
+    from rich.panel import Panel
+    from debai.generators.qcow2 import QCOW2Generator
+    
+    console = get_console()
+    
+    console.print(Panel(
+        f"[bold]Generating QCOW2 Image[/bold]\n\n"
+        f"Output: {output}\n"
+        f"Size: {size}\n"
+        f"Base: {base}",
+        title="QCOW2 Generation",
+        border_style="cyan",
+    ))
+    
+    generator = QCOW2Generator(
+        output_path=output,
+        disk_size=size,
+        base_distro=base,
+    )
+    
+    async def gen():
+        return await generator.generate()
+    
+    with spinner("Generating QCOW2..."):
+        result = run_async(gen())
+    
+    if result["success"]:
+        emit(
+            f"\n[green]✓ QCOW2 generated: {output}[/green]",
+            f"  Size: {result['size_mb']:.1f} MB",
+        )
+    else:
+        console.print(f"\n[red]✗ Failed to generate QCOW2[/red]")
+        if result.get("error"):
+            console.print(f"  Error: {result['error']}")
+
+
+@generate.command("compose")
+@click.option("-o", "--output", type=click.Path(dir_okay=False),
+              default="docker-compose.yml", help="Output file path")
+@click.option("--include-gui", is_flag=True, help="Include GUI service")
+@click.pass_context
+def generate_compose(ctx: click.Context, output: str, include_gui: bool) -> None:
+    """Generate a Docker Compose configuration."""
+    from debai.generators.compose import ComposeGenerator
+    
+    console = get_console()
+    
+    generator = ComposeGenerator(
+        output_path=output,
+        include_gui=include_gui,
+    )
+    
+    result = generator.generate()
+    
+    if result["success"]:
+        emit(
+            f"[green]✓ Docker Compose generated: {output}[/green]",
+            "\nStart with: [bold]docker compose up -d[/bold]",
+        )
+    else:
+        console.print(f"[red]✗ Failed to generate Docker Compose[/red]")
@@ -0,0 +1,135 @@
+"""
+Environment initialization command for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from debai import __version__
+
+from debai.cli.helpers import emit, get_console, run_async, spinner, print_banner
+
+
+@click.command()
+@click.option("--full", is_flag=True, help="Full initialization with model pull")
+@click.pass_context
+def init(ctx: click.Context, full: bool) -> None:
+    """Initialize Debai environment."""
+    console = get_console()
+    config_dir = Path.home() / ".config" / "debai"
+    sentinel = config_dir / ".initialized"
+    
+    if not full and _initialized_version(sentinel) == __version__:
+        console.print(
+            "[green]✓[/green] Debai is already initialized (use --full to run it again)"
+        )
+        return
+    
+    from concurrent.futures import ThreadPoolExecutor
+    from debai.core.model import ModelManager, get_recommended_model
+    from debai.core.system import check_dependencies
+    
+    # The console holds everything printed in this block and writes it out in
+    # one go, which matters on slow terminals such as nested SSH sessions
+    with console:
+        print_banner()
+        
+        console.print("\n[bold cyan]🚀 Initializing Debai...[/bold cyan]\n")
+        
+        # Create configuration directories
+        dirs = [
+            config_dir,
+            config_dir / "agents",
+            config_dir / "models",
+            config_dir / "tasks",
+            Path.home() / ".local" / "share" / "debai",
+        ]
+        
+        # mkdir latency adds up on network home directories, so create the
+        # missing ones side by side
+        missing_dirs = [d for d in dirs if not d.is_dir()]
+        # A missing parent is made by its subdirectory's mkdir(parents=True),
+        # so only the deepest missing directories need a call of their own
+        missing_parents = {d.parent for d in missing_dirs}
+        missing_dirs = [d for d in missing_dirs if d not in missing_parents]
+        if missing_dirs:
+            with ThreadPoolExecutor(max_workers=len(missing_dirs)) as executor:
+                list(executor.map(lambda d: d.mkdir(parents=True, exist_ok=True), missing_dirs))
+        emit(*(f"  [green]✓[/green] Created {d}" for d in dirs))
+        
+        # Check dependencies
+        console.print("\n[bold]Checking dependencies...[/bold]\n")
+        deps = check_dependencies()
+        
+        missing = [d for d, available in deps.items() if not available]
+        if missing:
+            emit(
+                f"[yellow]⚠ Missing dependencies: {', '.join(missing)}[/yellow]",
+                "\nInstall Docker Engine from official repository:",
+                "  [dim]# Add Docker's official GPG key[/dim]",
+                "  [dim]sudo apt-get update[/dim]",
+                "  [dim]sudo apt-get install ca-certificates curl[/dim]",
+                "  [dim]sudo install -m 0755 -d /etc/apt/keyrings[/dim]",
+                "  [dim]sudo curl -fsSL https://download.docker.com/linux/debian/gpg -o /etc/apt/keyrings/docker.asc[/dim]",
+                "  [dim]sudo chmod a+r /etc/apt/keyrings/docker.asc[/dim]",
+                "\n  [dim]# Add Docker repository[/dim]",
+                "  [dim]echo \"deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.asc] https://download.docker.com/linux/debian $(. /etc/os-release && echo \"$VERSION_CODENAME\") stable\" | sudo tee /etc/apt/sources.list.d/docker.list > /dev/null[/dim]",
+                "\n  [dim]# Install Docker Engine and tools[/dim]",
+                "  [dim]sudo apt-get update[/dim]",
+                "  [dim]sudo apt-get install docker-ce docker-ce-cli containerd.io qemu-utils genisoimage[/dim]",
+            )
+        else:
+            console.print("  [green]✓[/green] All dependencies available")
+        
+    if full:
+        # Pull recommended model
+        console.print("\n[bold]Pulling recommended model...[/bold]\n")
+        # A plain dict lookup; the manager is only needed if there is a model
+        config = get_recommended_model("general")
+        if config:
+            manager = ModelManager()
+            model = run_async(manager.add_model(config))
+            
+            # Both steps run on the CLI's shared event loop, so the pull's
+            # progress lines reach the spinner as docker prints them
+            with spinner(f"Pulling {config.id}...") as progress:
+                # Only the latest line is kept; the spinner redraws at its own rate
+                task_id = progress.task_ids[0]
+                pulled = run_async(model.pull(
+                    lambda line: progress.update(
+                        task_id, description=f"Pulling {config.id}: {line}"
+                    )
+                ))
+            if not pulled:
+                # Leave the sentinel unwritten so the next plain init runs again
+                emit(
+                    f"[red]✗ Failed to pull model '{config.id}'[/red]",
+                    "\n[bold yellow]Debai initialization is incomplete[/bold yellow]",
+                    f"Retry with: [bold]debai model pull {config.id}[/bold] "
+                    "or [bold]debai init --full[/bold]",
+                )
+                return
+    
+    sentinel.write_text(json.dumps({"version": __version__, "ts": time.time()}))
+    
+    emit(
+        "\n[bold green]✓ Debai initialized successfully![/bold green]",
+        "\nNext steps:",
+        "  1. Create an agent: [bold]debai agent create[/bold]",
+        "  2. Pull a model: [bold]debai model pull llama3.2:3b[/bold]",
+        "  3. Start the GUI: [bold]debai-gui[/bold]",
+    )
+
+
+def _initialized_version(sentinel: Path) -> Optional[str]:
+    """Get the Debai version recorded by the last successful ``init``, if any."""
+    try:
+        return json.loads(sentinel.read_text()).get("version")
+    except (OSError, ValueError, AttributeError):
+        return None
@@ -0,0 +1,174 @@
+"""
+Model management commands for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+import click
+
+from debai.cli.helpers import (
+    DOCKER_PROBE_TIMEOUT,
+    docker_available,
+    emit,
+    get_console,
+    get_model_manager,
+    run_async,
+    run_batch,
+)
+
+# Rich markup for status values shown in listings
+_MODEL_STATUS_ICONS = {
+    "ready": "[green]● Ready[/green]",
+    "loaded": "[green]● Loaded[/green]",
+    "pulling": "[yellow]● Pulling[/yellow]",
+    "not_pulled": "[dim]● Not Pulled[/dim]",
+    "error": "[red]● Error[/red]",
+}
+
+
+@click.group()
+def model() -> None:
+    """Manage AI models."""
+    pass
+
+
+@model.command("list")
+@click.pass_context
+def model_list(ctx: click.Context) -> None:
+    """List available models."""
+    import asyncio
+    from rich import box
+    from rich.table import Table
+    
+    console = get_console()
+    manager = get_model_manager()
+    
+    # Also try to discover from Docker Model, without letting an absent or
+    # unresponsive Docker delay the listing
+    async def discover():
+        try:
+            return await asyncio.wait_for(manager.discover_models(), DOCKER_PROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            console.print(
+                "[dim]Docker Model Runner did not respond; showing local models only[/dim]"
+            )
+            return []
+    
+    discovered = run_async(discover()) if docker_available() else []
+    
+    models = manager.list_models()
+    
+    if not models and not discovered:
+        emit(
+            "[yellow]No models found.[/yellow]",
+            "Pull a model with: [bold]debai model pull <model-id>[/bold]",
+        )
+        return
+    
+    table = Table(
+        title="[bold]AI Models[/bold]",
+        box=box.ROUNDED,
+        show_header=True,
+    )
+    table.add_column("ID", style="cyan")
+    table.add_column("Name")
+    table.add_column("Status")
+    table.add_column("Size")
+    
+    rows = [
+        (
+            m.id,
+            m.name,
+            _MODEL_STATUS_ICONS.get(m.status.value, m.status.value),
+            f"{m.config.size_bytes / (1024**3):.1f} GB" if m.config.size_bytes else "-",
+        )
+        for m in models
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(table)
+
+
+@model.command("pull")
+@click.argument("model_ids", nargs=-1, required=True)
+@click.option("--concurrency", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Maximum number of models pulled at once")
+@click.pass_context
+def model_pull(ctx: click.Context, model_ids: tuple[str, ...], concurrency: int) -> None:
+    """Pull one or more models from Docker Model Runner."""
+    from debai.core.model import ModelConfig, ModelManager
+    
+    manager = ModelManager()
+    model_ids = tuple(dict.fromkeys(model_ids))
+    
+    async def pull(model_id: str) -> bool:
+        m = await manager.add_model(ModelConfig(id=model_id, name=model_id))
+        return await m.pull()
+    
+    results = run_batch(
+        model_ids,
+        lambda model_id: f"Pulling model '{model_id}'...",
+        pull,
+        concurrency,
+    )
+    
+    emit(*(
+        f"[green]✓ Model '{model_id}' pulled successfully[/green]" if success
+        else f"[red]✗ Failed to pull model '{model_id}'[/red]"
+        for model_id, success in zip(model_ids, results)
+    ))
+
+
+@model.command("remove")
+@click.argument("model_id")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@click.pass_context
+def model_remove(ctx: click.Context, model_id: str, force: bool) -> None:
+    """Remove a model."""
+    console = get_console()
+    if not force:
+        if not click.confirm(f"Remove model '{model_id}'?", default=False):
+            return
+    
+    manager = get_model_manager()
+    
+    async def remove():
+        return await manager.remove_model(model_id)
+    
+    success = run_async(remove())
+    
+    if success:
+        console.print(f"[green]✓ Model '{model_id}' removed[/green]")
+    else:
+        console.print(f"[red]✗ Failed to remove model '{model_id}'[/red]")
+
+
+@model.command("recommended")
+def model_recommended() -> None:
+    """Show recommended models for different use cases."""
+    from rich import box
+    from rich.table import Table
+    from debai.core.model import list_recommended_models_with_configs
+    
+    table = Table(
+        title="[bold]Recommended Models[/bold]",
+        box=box.ROUNDED,
+        show_header=True,
+    )
+    table.add_column("Use Case")
+    table.add_column("Model")
+    table.add_column("Description")
+    table.add_column("Parameters")
+    
+    rows = [
+        (name, config.id, config.description, config.parameter_count)
+        for name, config in list_recommended_models_with_configs()
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    emit(
+        table,
+        "\nPull with: [bold]debai model pull <model-id>[/bold]",
+    )
@@ -0,0 +1,80 @@
+"""
+Resource monitor command for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+from operator import itemgetter
+
+import click
+
+from debai.cli.helpers import emit, get_console, run_async
+
+_FMT_PCT = "{:.1f}%".format
+_FMT_LOAD = "{:.2f}".format
+
+# Rows shown by the monitor, with the formatter for each value
+_MONITOR_ROWS = (
+    ("CPU", _FMT_PCT),
+    ("Memory", _FMT_PCT),
+    ("Load (1m)", _FMT_LOAD),
+    ("Load (5m)", _FMT_LOAD),
+    ("Load (15m)", _FMT_LOAD),
+)
+# Snapshot values in the same order as _MONITOR_ROWS
+_snapshot_values = itemgetter(
+    "cpu_percent", "memory_percent", "load_1min", "load_5min", "load_15min",
+)
+
+
+@click.command()
+@click.option("-i", "--interval", default=2.0, help="Update interval in seconds")
+@click.pass_context
+def monitor(ctx: click.Context, interval: float) -> None:
+    """Monitor system resources in real-time."""
+    import asyncio
+    from rich import box
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
+    from debai.core.system import ResourceMonitor
+    
+    console = get_console()
+    
+    emit(
+        "[bold]Starting resource monitor...[/bold]",
+        "[dim]Press Ctrl+C to exit[/dim]\n",
+    )
+    
+    monitor = ResourceMonitor(interval_seconds=interval)
+    
+    # The table is built once; each sample only rewrites the value cells
+    values = [Text() for _ in _MONITOR_ROWS]
+    table = Table(box=box.ROUNDED, show_header=False)
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    for (label, _), value in zip(_MONITOR_ROWS, values):
+        table.add_row(label, value)
+    
+    async def run_monitor():
+        # Only redraw when a new sample changes what is on screen
+        with Live(table, console=console, auto_refresh=False) as live:
+            def on_update(snapshot: dict) -> None:
+                changed = False
+                for value, (_, fmt), raw in zip(values, _MONITOR_ROWS, _snapshot_values(snapshot)):
+                    text = fmt(raw)
+                    if value.plain != text:
+                        value.plain = text
+                        changed = True
+                if changed:
+                    live.refresh()
+            
+            monitor.on_update(on_update)
+            await monitor.start()
+            try:
+                # Runs until cancelled by Ctrl+C
+                await asyncio.Event().wait()
+            finally:
+                await monitor.stop()
+    
+    run_async(run_monitor())
@@ -0,0 +1,89 @@
+"""
+Status command for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+import click
+
+from debai.cli.helpers import DOCKER_PROBE_TIMEOUT, get_console, run_async, print_banner
+
+
+@click.command()
+@click.pass_context
+def status(ctx: click.Context) -> None:
+    """Show system and Debai status."""
+    import asyncio
+    from rich import box
+    from rich.table import Table
+    from debai.core.system import SystemInfo, check_dependencies, get_docker_status
+    
+    console = get_console()
+    
+    async def probe():
+        # The probes are independent and mostly wait on subprocesses, so run
+        # them side by side instead of one after another
+        return await asyncio.gather(
+            asyncio.to_thread(SystemInfo.get_summary),
+            asyncio.to_thread(check_dependencies),
+            asyncio.to_thread(get_docker_status, DOCKER_PROBE_TIMEOUT),
+        )
+    
+    info, deps, docker = run_async(probe())
+    
+    print_banner()
+    
+    # System information
+    console.print("\n[bold cyan]📊 System Information[/bold cyan]\n")
+    
+    table = Table(box=box.ROUNDED, show_header=False, padding=(0, 2))
+    table.add_column("Property", style="bold")
+    table.add_column("Value")
+    
+    cpu = info["cpu"]
+    rows = [
+        ("Hostname", info["hostname"]),
+        ("OS", f"{info['os']['system']} {info['os']['release']}"),
+        ("Distribution", f"{info['distro']['name']} {info['distro']['version']}"),
+        ("CPU", (cpu.get("model") or "Unknown")[:50]),
+        ("Cores", f"{cpu['cores_physical']} physical / {cpu['cores_logical']} logical"),
+        ("CPU Usage", f"{cpu['usage_percent']:.1f}%"),
+        ("Memory", f"{info['memory']['percent_used']:.1f}% used"),
+        ("Uptime", info["uptime"]),
+        ("Load", ", ".join(f"{load:.2f}" for load in info["load_average"])),
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(table)
+    
+    # Dependencies
+    console.print("\n[bold cyan]🔧 Dependencies[/bold cyan]\n")
+    
+    dep_table = Table(box=box.ROUNDED, show_header=True, padding=(0, 2))
+    dep_table.add_column("Dependency")
+    dep_table.add_column("Status")
+    
+    for dep, available in deps.items():
+        status_icon = "[green]✓ Available[/green]" if available else "[red]✗ Missing[/red]"
+        dep_table.add_row(dep, status_icon)
+    
+    console.print(dep_table)
+    
+    # Docker status
+    if docker["installed"]:
+        console.print("\n[bold cyan]🐳 Docker Status[/bold cyan]\n")
+        docker_table = Table(box=box.ROUNDED, show_header=False, padding=(0, 2))
+        docker_table.add_column("Property", style="bold")
+        docker_table.add_column("Value")
+        
+        rows = [
+            ("Version", docker["version"]),
+            ("Running", "[green]Yes[/green]" if docker["running"] else "[red]No[/red]"),
+            ("Containers", str(docker["containers"])),
+            ("Images", str(docker["images"])),
+        ]
+        for row in rows:
+            docker_table.add_row(*row)
+        
+        console.print(docker_table)
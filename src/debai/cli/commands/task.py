@@ -0,0 +1,210 @@
+"""
+Task management commands for the Debai CLI.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+from debai.cli.helpers import TaskParam, emit, get_console, get_task_manager, run_async
+
+if TYPE_CHECKING:
+    from debai.core.task import Task
+
+# Choice values mirror debai.core.task.TaskPriority; they are spelled out here
+# to avoid importing the core models at decoration time.
+TASK_PRIORITY_CHOICES = ("low", "normal", "high", "critical")
+
+# Number of output lines shown while a task is running
+TASK_LIVE_LINES = 20
+
+# Rich markup for status and priority values shown in listings
+_TASK_STATUS_ICONS = {
+    "pending": "[dim]○ Pending[/dim]",
+    "scheduled": "[blue]◐ Scheduled[/blue]",
+    "running": "[yellow]● Running[/yellow]",
+    "completed": "[green]✓ Completed[/green]",
+    "failed": "[red]✗ Failed[/red]",
+    "cancelled": "[dim]✗ Cancelled[/dim]",
+}
+_TASK_PRIORITY_STYLES = {
+    "low": "[dim]Low[/dim]",
+    "normal": "Normal",
+    "high": "[yellow]High[/yellow]",
+    "critical": "[red bold]Critical[/red bold]",
+}
+
+
+@click.group()
+def task() -> None:
+    """Manage automated tasks."""
+    pass
+
+
+@task.command("list")
+@click.option("-s", "--status", type=click.Choice(["pending", "running", "completed", "failed", "all"]), default="all")
+@click.pass_context
+def task_list(ctx: click.Context, status: str) -> None:
+    """List all tasks."""
+    from rich import box
+    from rich.table import Table
+    from debai.core.task import TaskStatus
+    
+    console = get_console()
+    manager = get_task_manager()
+    
+    tasks = manager.list_tasks(status=None if status == "all" else TaskStatus(status))
+    
+    if not tasks:
+        if status != "all":
+            console.print(f"[yellow]No {status} tasks found[/yellow]")
+        else:
+            console.print("[yellow]No tasks found. Create one with 'debai task create'[/yellow]")
+        return
+    
+    table = Table(
+        title="[bold]Tasks[/bold]",
+        box=box.ROUNDED,
+        show_header=True,
+    )
+    table.add_column("ID", style="cyan")
+    table.add_column("Name")
+    table.add_column("Type")
+    table.add_column("Priority")
+    table.add_column("Status")
+    
+    rows = [
+        (
+            t.id,
+            t.name,
+            t.config.task_type,
+            _TASK_PRIORITY_STYLES.get(t.config.priority, t.config.priority),
+            _TASK_STATUS_ICONS.get(t.status.value, t.status.value),
+        )
+        for t in tasks
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(table)
+
+
+@task.command("create")
+@click.option("-n", "--name", prompt="Task name", help="Name for the task")
+@click.option("-c", "--command", prompt="Command to run", help="Shell command to execute")
+@click.option("-p", "--priority", 
+              type=click.Choice(TASK_PRIORITY_CHOICES),
+              default="normal", help="Task priority")
+@click.option("--template", help="Use a predefined template")
+@click.pass_context
+def task_create(
+    ctx: click.Context,
+    name: str,
+    command: str,
+    priority: str,
+    template: Optional[str],
+) -> None:
+    """Create a new task."""
+    from debai.core.task import (
+        TaskConfig, TaskManager, TaskPriority, get_task_template, list_task_templates,
+    )
+    
+    if template:
+        config = get_task_template(template)
+        if not config:
+            emit(
+                f"[red]Template '{template}' not found[/red]",
+                f"Available templates: {', '.join(list_task_templates())}",
+            )
+            return
+        config.name = name
+    else:
+        config = TaskConfig(
+            name=name,
+            command=command,
+            priority=TaskPriority(priority),
+        )
+    
+    manager = TaskManager()
+    
+    async def create():
+        return await manager.create_task(config)
+    
+    task = run_async(create())
+    
+    emit(
+        f"\n[green]✓ Task created successfully![/green]",
+        f"  ID: [cyan]{task.id}[/cyan]",
+        f"  Name: {task.name}",
+        f"\nRun with: [bold]debai task run {task.id}[/bold]",
+    )
+
+
+@task.command("run")
+@click.argument("t", metavar="TASK_ID", type=TaskParam())
+@click.pass_context
+def task_run(ctx: click.Context, t: Task) -> None:
+    """Run a task."""
+    from collections import deque
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    console = get_console()
+    
+    # Only the most recent lines are shown while the task runs
+    recent: deque[str] = deque(maxlen=TASK_LIVE_LINES)
+    
+    async def run():
+        with Live(console=console, transient=True, refresh_per_second=8) as live:
+            async for _, line in t.stream():
+                recent.append(line.decode(errors="replace"))
+                output = Text("".join(recent).rstrip())
+                live.update(Panel(output, title="Output", border_style="dim"))
+        return t.last_result
+    
+    console.print(f"[bold]Running task: {t.name}[/bold]\n")
+    
+    result = run_async(run())
+    
+    if result.success:
+        console.print(f"[green]✓ Task completed successfully[/green]")
+        if result.stdout:
+            console.print(Panel(Text(result.stdout.rstrip()), title="Output", border_style="green"))
+    else:
+        console.print(f"[red]✗ Task failed[/red]")
+        if result.stderr:
+            console.print(Panel(Text(result.stderr.rstrip()), title="Error", border_style="red"))
+    
+    console.print(f"\n[dim]Duration: {result.duration_seconds:.2f}s[/dim]")
+
+
+@task.command("templates")
+def task_templates() -> None:
+    """List available task templates."""
+    from rich import box
+    from rich.table import Table
+    from debai.core.task import list_task_templates_with_configs
+    
+    table = Table(
+        title="[bold]Task Templates[/bold]",
+        box=box.ROUNDED,
+        show_header=True,
+    )
+    table.add_column("Template")
+    table.add_column("Description")
+    table.add_column("Priority")
+    
+    rows = [
+        (name, config.description, config.priority)
+        for name, config in list_task_templates_with_configs()
+    ]
+    for row in rows:
+        table.add_row(*row)
+    
+    emit(
+        table,
+        "\nUse with: [bold]debai task create --template <name>[/bold]",
+    )
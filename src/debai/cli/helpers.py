@@ -0,0 +1,337 @@
+"""
+Shared helpers for the Debai command-line interface.
+
+Everything here is cheap to import: apart from Click, which the CLI needs
+anyway, Rich, asyncio and the debai.core modules are only imported when a
+helper that needs them is first called.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Iterator, Optional, Sequence, TypeVar,
+)
+
+import click
+
+if TYPE_CHECKING:
+    import asyncio
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.segment import Segments
+    from rich.text import Text
+    from debai.core.agent import Agent, AgentManager
+    from debai.core.model import ModelManager
+    from debai.core.task import Task, TaskManager
+
+T = TypeVar("T")
+
+# Seconds to wait for the Docker daemon before reporting it as not running
+DOCKER_PROBE_TIMEOUT = 2.0
+
+BANNER = """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                                                              ║
+    ║     ██████╗ ███████╗██████╗  █████╗ ██╗                      ║
+    ║     ██╔══██╗██╔════╝██╔══██╗██╔══██╗██║                      ║
+    ║     ██║  ██║█████╗  ██████╔╝███████║██║                      ║
+    ║     ██║  ██║██╔══╝  ██╔══██╗██╔══██║██║                      ║
+    ║     ██████╔╝███████╗██████╔╝██║  ██║██║                      ║
+    ║     ╚═════╝ ╚══════╝╚═════╝ ╚═╝  ╚═╝╚═╝                      ║
+    ║                                                              ║
+    ║     AI Agent Management System for GNU/Linux                 ║
+    ║                                                              ║
+    ╚══════════════════════════════════════════════════════════════╝
+    """
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Get the shared Rich console, creating it on first use."""
+    from rich.console import Console
+    
+    return Console()
+
+
+def emit(*renderables: Any) -> None:
+    """
+    Print several lines or renderables with a single write.
+    
+    Each ``console.print`` call flushes on its own, so related output such as
+    a success summary is printed in one go instead.
+    """
+    if renderables:
+        get_console().print(*renderables, sep="\n")
+
+
+@lru_cache(maxsize=1)
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop shared by all commands, creating it on first use."""
+    import asyncio
+    
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+    atexit.register(_close_loop, loop)
+    return loop
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop event loop if it is installed, else a standard one."""
+    import asyncio
+    
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    # Create the loop directly rather than through uvloop.install(), which
+    # replaces the global policy and is deprecated in recent uvloop releases
+    return uvloop.new_event_loop()
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Close API sessions, shut down async generators and close the shared event loop."""
+    if loop.is_closed():
+        return
+    try:
+        # Close the model manager's Model Runner API sessions on their loop
+        models = _managers.get("models")
+        if models:
+            loop.run_until_complete(models[1].close())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the shared event loop."""
+    loop = _get_loop()
+    task = loop.create_task(coro)
+    try:
+        return loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        # Give the coroutine a chance to run its cleanup, as asyncio.run() does
+        task.cancel()
+        try:
+            loop.run_until_complete(task)
+        except BaseException:
+            pass
+        raise
+
+
+# Loaded managers keyed by kind, with the signature of their config directory
+_managers: dict[str, tuple[tuple[tuple[str, int], ...], Any]] = {}
+
+
+def _config_signature(config_dir: Path) -> tuple[tuple[str, int], ...]:
+    """Get the names and modification times of the YAML files in a directory."""
+    try:
+        with os.scandir(config_dir) as entries:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(".yaml")
+            ))
+    except OSError:
+        return ()
+
+
+def _cached_manager(kind: str, factory: Callable[[], T], load: Callable[[T], Any]) -> T:
+    """Get a loaded manager, reloading only if its config files changed on disk."""
+    cached = _managers.get(kind)
+    manager = cached[1] if cached else factory()
+    signature = _config_signature(manager.config_dir)
+    if cached and cached[0] == signature:
+        return manager
+    
+    if cached:
+        manager = factory()
+    load(manager)
+    _managers[kind] = (signature, manager)
+    return manager
+
+
+@lru_cache(maxsize=1)
+def docker_available() -> bool:
+    """Check whether the docker client is installed, without starting it."""
+    import shutil
+    
+    return shutil.which("docker") is not None
+
+
+def get_agent_manager() -> AgentManager:
+    """Get the process-wide agent manager with agents loaded."""
+    from debai.core.agent import AgentManager
+    
+    return _cached_manager("agents", AgentManager, AgentManager.load_agents)
+
+
+def get_model_manager() -> ModelManager:
+    """Get the process-wide model manager with models loaded."""
+    from debai.core.model import ModelManager
+    
+    return _cached_manager("models", ModelManager, ModelManager.load_models)
+
+
+def get_task_manager() -> TaskManager:
+    """Get the process-wide task manager with tasks loaded."""
+    from debai.core.task import TaskManager
+    
+    return _cached_manager("tasks", TaskManager, TaskManager.load_tasks)
+
+
+async def in_daemon_thread(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking call in a daemon thread without blocking the event loop.
+    
+    Unlike asyncio.to_thread(), the thread does not keep the interpreter
+    alive, so a prompt still waiting for input cannot delay exit on Ctrl+C.
+    """
+    import asyncio
+    import threading
+    
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def target() -> None:
+        try:
+            outcome = (func(*args), None)
+        except BaseException as e:
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(resolve, *outcome)
+        except RuntimeError:
+            # The loop was closed while we were blocked
+            pass
+    
+    threading.Thread(target=target, daemon=True).start()
+    return await future
+
+
+def make_progress() -> Progress:
+    """Create a spinner progress display with the CLI's shared settings."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=get_console(),
+        transient=True,
+        refresh_per_second=8,
+    )
+
+
+@contextmanager
+def spinner(description: str) -> Iterator[Progress]:
+    """Show a single spinner with ``description`` while the block runs."""
+    with make_progress() as progress:
+        progress.add_task(description, total=None)
+        yield progress
+
+
+def run_batch(
+    items: Sequence[T],
+    describe: Callable[[T], str],
+    action: Callable[[T], Awaitable[bool]],
+    concurrency: int,
+) -> list[bool]:
+    """
+    Run an async action for each item, at most ``concurrency`` at a time.
+    
+    A spinner is shown for every item in progress. Results are returned in
+    the same order as ``items``.
+    """
+    import asyncio
+    
+    async def run_all() -> list[bool]:
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        with make_progress() as progress:
+            async def run_one(item: T) -> bool:
+                async with semaphore:
+                    task_id = progress.add_task(describe(item), total=None)
+                    try:
+                        return await action(item)
+                    finally:
+                        progress.remove_task(task_id)
+            
+            return list(await asyncio.gather(*(run_one(item) for item in items)))
+    
+    return run_async(run_all())
+
+
+def unique_agents(agents: Sequence[Agent]) -> list[Agent]:
+    """Drop agents given more than once, keeping the original order."""
+    return list({agent.id: agent for agent in agents}.values())
+
+
+class AgentParam(click.ParamType):
+    """Click parameter type that resolves an agent ID to the loaded Agent."""
+    
+    name = "agent_id"
+    
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context],
+    ) -> Agent:
+        from debai.core.agent import Agent
+        
+        if isinstance(value, Agent):
+            return value
+        agent = get_agent_manager().get_agent(value)
+        if agent is None:
+            self.fail(f"Agent '{value}' not found", param, ctx)
+        return agent
+
+
+class TaskParam(click.ParamType):
+    """Click parameter type that resolves a task ID to the loaded Task."""
+    
+    name = "task_id"
+    
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context],
+    ) -> Task:
+        from debai.core.task import Task
+        
+        if isinstance(value, Task):
+            return value
+        task = get_task_manager().get_task(value)
+        if task is None:
+            self.fail(f"Task '{value}' not found", param, ctx)
+        return task
+
+
+@lru_cache(maxsize=1)
+def _banner() -> Text:
+    """Get the styled banner, built once per process."""
+    from rich.text import Text
+    
+    return Text(BANNER, style="bold cyan")
+
+
+@lru_cache(maxsize=8)
+def _rendered_banner(width: int) -> Segments:
+    """Get the banner already laid out for a terminal ``width``."""
+    from rich.segment import Segments
+    
+    console = get_console()
+    options = console.options.update_width(width)
+    return Segments(console.render(_banner(), options))
+
+
+def print_banner() -> None:
+    """Print the Debai banner."""
+    console = get_console()
+    console.print(_rendered_banner(console.width))
@@ -2,10 +2,23 @@
 Core module for Debai - Contains the main business logic.
 """
 
-from debai.core.agent import Agent, AgentConfig, AgentManager
-from debai.core.model import Model, ModelConfig, ModelManager
-from debai.core.task import Task, TaskConfig, TaskManager
-from debai.core.system import SystemInfo, ResourceMonitor
+from typing import Any
+
+# Submodules are imported on first access, so importing one of them (e.g.
+# debai.core.system for ``debai status``) does not load all the others.
+_LAZY_EXPORTS = {
+    "Agent": "debai.core.agent",
+    "AgentConfig": "debai.core.agent",
+    "AgentManager": "debai.core.agent",
+    "Model": "debai.core.model",
+    "ModelConfig": "debai.core.model",
+    "ModelManager": "debai.core.model",
+    "Task": "debai.core.task",
+    "TaskConfig": "debai.core.task",
+    "TaskManager": "debai.core.task",
+    "SystemInfo": "debai.core.system",
+    "ResourceMonitor": "debai.core.system",
+}
 
 __all__ = [
     "Agent",
@@ -20,3 +33,14 @@ __all__ = [
     "SystemInfo",
     "ResourceMonitor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -8,19 +8,34 @@ interacting with AI agents using the cagent framework.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import os
+import re
+import socket
 import subprocess
+import threading
+import time
 import uuid
+import weakref
+import zlib
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Iterable, Literal, Optional
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from debai.core.config import cache_path_for, load_yaml_cached, save_yaml_cached, write_yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +50,8 @@ class AgentStatus(str, Enum):
     WAITING = "waiting"
 
 
+# The CLI spells these values out in AGENT_TYPE_CHOICES (debai.cli.commands.agent)
+# so it doesn't import this module at startup; update both together.
 class AgentType(str, Enum):
     """Types of agents available."""
     SYSTEM = "system"           # System maintenance tasks
@@ -74,6 +91,7 @@ class AgentConfig(BaseModel):
     interactive: bool = Field(default=True)
     max_retries: int = Field(default=3, ge=0, le=10)
     timeout_seconds: int = Field(default=300, ge=10, le=3600)
+    history_max: int = Field(default=1000, ge=1, description="Messages kept in memory")
     
     # Resource limits
     max_memory_mb: int = Field(default=512, ge=64, le=8192)
@@ -101,20 +119,217 @@ class AgentConfig(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     tags: list[str] = Field(default_factory=list)
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
+    
+    def is_denied(self, command: str) -> bool:
+        """Check if a command contains any of the denied commands."""
+        pattern = _denied_pattern(tuple(self.denied_commands))
+        return pattern is not None and pattern.search(command) is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _denied_pattern(denied_commands: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Compile a deny list into one regex, so a command is scanned only once."""
+    if not denied_commands:
+        return None
+    return re.compile("|".join(map(re.escape, denied_commands)))
 
 
 class AgentMessage(BaseModel):
     """Message exchanged with an agent."""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    role: str = Field(..., pattern="^(user|assistant|system)$")
+    # A Literal (unlike a pattern) stores the shared constant string, so
+    # messages in a long history don't each keep their own copy of the role
+    role: Literal["user", "assistant", "system"]
     content: str
     timestamp: datetime = Field(default_factory=datetime.now)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+# Models known to be available in docker-model, shared by all agents
+_available_models: set[str] = set()
+# asyncio locks can't be shared between event loops (the GUI runs each
+# action on its own loop), so there is one per loop
+_available_models_locks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Lock
+] = weakref.WeakKeyDictionary()
+
+
+def _model_listed(check_name: str, names: Iterable[str]) -> bool:
+    """
+    Check if a model is among names listed by docker-model.
+    
+    The listing and the cache of it use this same rule. Names match by
+    substring, so "llama3.2:3b" is found as "ai/llama3.2:3b".
+    """
+    return any(check_name in name for name in names)
+
+
+# Variables passed on from debai's environment to agent processes; anything
+# else an agent needs goes in its config's environment
+_ALLOWED_ENV_KEYS = frozenset({
+    "PATH", "HOME", "USER", "LOGNAME", "SHELL", "LANG", "TZ", "TERM", "TMPDIR",
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR",
+})
+_ALLOWED_ENV_PREFIXES = ("LC_", "XDG_", "DOCKER_")
+# Model provider credentials, e.g. OPENAI_API_KEY
+_ALLOWED_ENV_SUFFIXES = ("_API_KEY",)
+
+
+@functools.lru_cache(maxsize=1)
+def _base_environment() -> dict[str, str]:
+    """Get the part of debai's environment that agent processes inherit."""
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key in _ALLOWED_ENV_KEYS
+        or key.startswith(_ALLOWED_ENV_PREFIXES)
+        or key.endswith(_ALLOWED_ENV_SUFFIXES)
+    }
+
+
+# First port and number of ports handed out to agent API servers
+AGENT_PORT_BASE = 8000
+AGENT_PORT_RANGE = 1000
+
+# Ports given to agents started by this process. cagent only binds its port
+# some time after it is spawned, so agents starting together would otherwise
+# all see the same port as free.
+_reserved_ports: set[int] = set()
+_ports_lock = threading.Lock()
+
+
+def _reserve_port(port: int) -> None:
+    """Mark a port as used by an agent started by this process."""
+    with _ports_lock:
+        _reserved_ports.add(port)
+
+
+def _allocate_port(agent_id: str) -> int:
+    """
+    Pick a free port for an agent's API server.
+    
+    The search starts at a port derived from the agent ID, so an agent gets
+    the same port across restarts unless something else has taken it.
+    """
+    start = zlib.crc32(agent_id.encode()) % AGENT_PORT_RANGE
+    with _ports_lock:
+        for offset in range(AGENT_PORT_RANGE):
+            port = AGENT_PORT_BASE + (start + offset) % AGENT_PORT_RANGE
+            if port in _reserved_ports:
+                continue
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.bind(("", port))
+                except OSError:
+                    continue
+            _reserved_ports.add(port)
+            return port
+    raise RuntimeError(
+        f"No free port between {AGENT_PORT_BASE} and {AGENT_PORT_BASE + AGENT_PORT_RANGE - 1}"
+    )
+
+
+def _read_cmdline(pid: int) -> list[str]:
+    """Get the arguments of a running process, or an empty list if it is gone."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read().decode(errors="replace").split("\0")
+    except OSError:
+        return []
+
+
+def _scan_cagent_processes() -> dict[str, int]:
+    """Map each argument of every running cagent process to its PID."""
+    processes: dict[str, int] = {}
+    try:
+        import psutil
+    except ImportError:
+        # psutil not available, so agents started elsewhere can't be found
+        return processes
+    
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        try:
+            if proc.info['name'] == 'cagent' and proc.info['cmdline']:
+                for arg in proc.info['cmdline']:
+                    processes[arg] = proc.info['pid']
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return processes
+
+
+# Agent status changes, as (current status, event) -> new status. Agents
+# started by another debai process are only seen through polling, which
+# reports "process_found" or "exit_detected".
+_TRANSITIONS: dict[tuple[AgentStatus, str], AgentStatus] = {
+    (AgentStatus.STOPPED, "start_requested"): AgentStatus.STARTING,
+    (AgentStatus.ERROR, "start_requested"): AgentStatus.STARTING,
+    (AgentStatus.PAUSED, "start_requested"): AgentStatus.STARTING,
+    (AgentStatus.WAITING, "start_requested"): AgentStatus.STARTING,
+    (AgentStatus.STARTING, "spawn_succeeded"): AgentStatus.RUNNING,
+    (AgentStatus.STARTING, "spawn_failed"): AgentStatus.ERROR,
+    (AgentStatus.STOPPED, "process_found"): AgentStatus.RUNNING,
+    (AgentStatus.ERROR, "process_found"): AgentStatus.RUNNING,
+    (AgentStatus.STARTING, "process_found"): AgentStatus.RUNNING,
+    (AgentStatus.PAUSED, "process_found"): AgentStatus.RUNNING,
+    (AgentStatus.WAITING, "process_found"): AgentStatus.RUNNING,
+    (AgentStatus.RUNNING, "exit_detected"): AgentStatus.STOPPED,
+    **{(status, "stop_completed"): AgentStatus.STOPPED for status in AgentStatus},
+}
+
+
+# Callback table of agents without callbacks; copied by Agent.on() before
+# the first callback is added, and never modified
+_NO_CALLBACKS: dict[str, tuple[Callable, ...]] = {
+    "on_start": (),
+    "on_stop": (),
+    "on_message": (),
+    "on_error": (),
+    "on_task_complete": (),
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the values stdlib json can't, the way orjson does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _guard_callback(event: str, callback: Callable) -> Callable[..., None]:
+    """
+    Wrap an event callback so that its errors are logged rather than raised.
+    
+    Coroutine functions are scheduled on the running event loop instead of
+    being awaited, so a slow callback cannot hold up the agent.
+    """
+    def log_error(e: BaseException) -> None:
+        logger.error(f"Error in callback for {event}: {e}")
+    
+    if asyncio.iscoroutinefunction(callback):
+        def log_task_error(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                log_error(task.exception())
+        
+        def guarded(*args, **kwargs) -> None:
+            try:
+                task = asyncio.get_running_loop().create_task(callback(*args, **kwargs))
+            except Exception as e:
+                log_error(e)
+                return
+            task.add_done_callback(log_task_error)
+    else:
+        def guarded(*args, **kwargs) -> None:
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                log_error(e)
+    
+    return guarded
+
+
 class Agent:
     """
     AI Agent that can perform system tasks autonomously.
@@ -127,15 +342,17 @@ class Agent:
         self.config = config
         self.status = AgentStatus.STOPPED
         self.process: Optional[subprocess.Popen] = None
-        self.message_history: list[AgentMessage] = []
-        self._callbacks: dict[str, list[Callable]] = {
-            "on_start": [],
-            "on_stop": [],
-            "on_message": [],
-            "on_error": [],
-            "on_task_complete": [],
-        }
+        # Only the most recent messages are kept, so long-running agents
+        # don't grow without bound
+        self.message_history: deque[AgentMessage] = deque(maxlen=config.history_max)
+        # Tuples of guarded callbacks, replaced as a whole when one is added.
+        # Agents share the empty table until their first on() call.
+        self._callbacks: dict[str, tuple[Callable, ...]] = _NO_CALLBACKS
         self._lock = asyncio.Lock()
+        # Held while a message is being handled
+        self._invoke_lock = asyncio.Lock()
+        # Port of the cagent API while started by this process
+        self.api_port: Optional[int] = None
         
     @property
     def id(self) -> str:
@@ -145,91 +362,127 @@ class Agent:
     def name(self) -> str:
         return self.config.name
     
-    def is_alive(self) -> bool:
-        """Check if the agent process is still running."""
+    def is_alive(
+        self, scan: Callable[[], dict[str, int]] = _scan_cagent_processes,
+    ) -> bool:
+        """
+        Check if the agent process is still running.
+        
+        ``scan`` is used to search the process table when the agent has no PID
+        file; AgentManager passes a memoized one to search it only once.
+        """
         # First check if we have a subprocess object
         if self.process is not None:
             return self.process.poll() is None
         
-        # If no process object, search for cagent process with our config file
+        # If no process object, look for a cagent process started elsewhere
+        return self._find_pid(scan) is not None
+    
+    def _find_pid(
+        self, scan: Callable[[], dict[str, int]] = _scan_cagent_processes,
+    ) -> Optional[int]:
+        """Find the PID of this agent's cagent process, started by any debai process."""
+        work_dir = Path(self.config.working_directory)
+        agent_config_path = str(work_dir / f"agent_{self.id}.yaml")
+        
+        # start() records the PID, so normally only that one process is checked
         try:
-            import psutil
-            work_dir = Path(self.config.working_directory)
-            agent_config_path = work_dir / f"agent_{self.id}.yaml"
-            
-            # Search for cagent processes
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if proc.info['name'] == 'cagent' and proc.info['cmdline']:
-                        cmdline = ' '.join(proc.info['cmdline'])
-                        if str(agent_config_path) in cmdline:
-                            return True
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except ImportError:
-            # psutil not available, fall back to checking self.process only
-            pass
+            pid = int((work_dir / f"agent_{self.id}.pid").read_text())
+        except (OSError, ValueError):
+            # No PID file (e.g. the agent was started by an older version)
+            return scan().get(agent_config_path)
+        return pid if agent_config_path in _read_cmdline(pid) else None
+    
+    def update_status(self, alive: Optional[bool] = None) -> None:
+        """
+        Update the agent status based on process state.
         
-        return False
+        ``alive`` is the result of is_alive() if the caller already has it.
+        """
+        if alive is None:
+            alive = self.is_alive()
+        self._transition("process_found" if alive else "exit_detected")
     
-    def update_status(self) -> None:
-        """Update the agent status based on process state."""
-        if self.is_alive():
-            # Process is running, update status to RUNNING
-            if self.status in (AgentStatus.STOPPED, AgentStatus.ERROR, AgentStatus.STARTING):
-                self.status = AgentStatus.RUNNING
-        else:
-            # Process is not running, update status to STOPPED
-            if self.status == AgentStatus.RUNNING:
-                self.status = AgentStatus.STOPPED
+    def _transition(self, event: str) -> AgentStatus:
+        """Apply a lifecycle event to the status; events that don't apply are ignored."""
+        self.status = _TRANSITIONS.get((self.status, event), self.status)
+        return self.status
+    
+    def _release_port(self) -> None:
+        """Give the API port back for other agents to use."""
+        if self.api_port is not None:
+            with _ports_lock:
+                _reserved_ports.discard(self.api_port)
+            self.api_port = None
+    
+    def _process_environment(self) -> dict[str, str]:
+        """Get the environment for the agent's cagent processes."""
+        # The inherited part is computed once per debai process; the agent's
+        # own variables are read each time, as the config may be edited
+        return {**_base_environment(), **self.config.environment}
     
     def on(self, event: str, callback: Callable) -> None:
         """Register an event callback."""
         if event in self._callbacks:
-            self._callbacks[event].append(callback)
+            if self._callbacks is _NO_CALLBACKS:
+                self._callbacks = dict(_NO_CALLBACKS)
+            self._callbacks[event] += (_guard_callback(event, callback),)
     
     def _emit(self, event: str, *args, **kwargs) -> None:
         """Emit an event to all registered callbacks."""
-        for callback in self._callbacks.get(event, []):
-            try:
-                callback(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Error in callback for {event}: {e}")
+        for callback in self._callbacks.get(event, ()):
+            callback(*args, **kwargs)
     
-    async def start(self) -> bool:
-        """Start the agent."""
+    async def start(self, port: Optional[int] = None) -> bool:
+        """
+        Start the agent.
+        
+        The agent's API listens on ``port``, or on a free port picked from
+        the agent ID if not given.
+        """
+        # Checked again under the lock; this only skips taking it when the
+        # agent is plainly running already
+        if self.status == AgentStatus.RUNNING:
+            logger.warning(f"Agent {self.name} is already running")
+            return True
+        
         async with self._lock:
             if self.status == AgentStatus.RUNNING:
                 logger.warning(f"Agent {self.name} is already running")
                 return True
             
             try:
-                self.status = AgentStatus.STARTING
+                self._transition("start_requested")
                 logger.info(f"Starting agent {self.name}...")
                 
-                # Create working directory
+                # Generate agent configuration for cagent. The working
+                # directory normally exists from an earlier start, so it is
+                # only created when writing into it fails.
                 work_dir = Path(self.config.working_directory)
-                work_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Generate agent configuration for cagent
                 agent_config_path = work_dir / f"agent_{self.id}.yaml"
-                self._write_cagent_config(agent_config_path)
+                try:
+                    model_id = self._write_cagent_config(agent_config_path)
+                except FileNotFoundError:
+                    work_dir.mkdir(parents=True, exist_ok=True)
+                    model_id = self._write_cagent_config(agent_config_path)
                 
                 # Check if model is available, download if needed
-                # Get the model ID from the config we just wrote
-                with open(agent_config_path) as f:
-                    config_data = yaml.safe_load(f)
-                    model_id = config_data["agents"]["root"]["model"]
-                
-                if not self._check_model_available(model_id):
+                if not await self._check_model_available(model_id):
                     logger.info(f"Model {model_id} not found locally, downloading...")
-                    if not self._pull_model(model_id):
+                    # The pull can take minutes; keep the event loop (and other
+                    # agents starting alongside) running meanwhile
+                    if not await asyncio.to_thread(self._pull_model, model_id):
                         raise Exception(f"Failed to download model {model_id}")
+                    _available_models.add(model_id.replace("dmr/", ""))
                 
                 # Start cagent API server
                 # Use 'cagent api' to run agent as HTTP API service
-                # Each agent gets a unique port based on hash of agent ID
-                port = 8000 + (hash(self.id) % 1000)
+                self._release_port()
+                if port is None:
+                    port = _allocate_port(self.id)
+                else:
+                    _reserve_port(port)
+                self.api_port = port
                 
                 cmd = [
                     "cagent",
@@ -242,14 +495,29 @@ class Agent:
                 logger.debug(f"Starting agent with command: {' '.join(cmd)}")
                 logger.info(f"Agent API will listen on port {port}")
                 
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    cwd=str(work_dir),
-                    env={**os.environ, **self.config.environment},
-                )
+                # The server's output goes to a log file rather than a pipe:
+                # nothing reads a pipe while the agent runs, so it would fill
+                # up and stall cagent, and it breaks once debai exits
+                log_path = work_dir / f"agent_{self.id}.log"
+                
+                # Spawn from a worker thread so fork/exec doesn't block the event
+                # loop and several agents can start at once. This stays a plain
+                # Popen: an asyncio subprocess is killed when its event loop is
+                # closed, but the agent must outlive the debai command that
+                # started it.
+                with open(log_path, "wb") as log_file:
+                    self.process = await asyncio.to_thread(
+                        subprocess.Popen,
+                        cmd,
+                        stdin=subprocess.DEVNULL,
+                        stdout=log_file,
+                        stderr=subprocess.STDOUT,
+                        cwd=str(work_dir),
+                        env=self._process_environment(),
+                    )
+                
+                # Let other debai processes find the agent without scanning /proc
+                (work_dir / f"agent_{self.id}.pid").write_text(str(self.process.pid))
                 
                 # Give it a moment to start
                 await asyncio.sleep(0.5)
@@ -257,16 +525,17 @@ class Agent:
                 # Check if process is still running
                 if self.process.poll() is not None:
                     # Process died immediately
-                    stderr = self.process.stderr.read().decode() if self.process.stderr else ""
-                    raise Exception(f"Agent process exited immediately: {stderr}")
+                    output = log_path.read_text(errors="replace")
+                    raise Exception(f"Agent process exited immediately: {output}")
                 
-                self.status = AgentStatus.RUNNING
+                self._transition("spawn_succeeded")
                 self._emit("on_start", self)
                 logger.info(f"Agent {self.name} started successfully")
                 return True
                 
             except Exception as e:
-                self.status = AgentStatus.ERROR
+                self._transition("spawn_failed")
+                self._release_port()
                 self._emit("on_error", self, e)
                 logger.error(f"Failed to start agent {self.name}: {e}")
                 return False
@@ -282,41 +551,40 @@ class Agent:
             
             try:
                 # Try to stop via subprocess object first
+                # Waits run in a worker thread so AgentManager.stop_all() can
+                # stop agents concurrently
                 if self.process:
                     self.process.terminate()
                     try:
-                        self.process.wait(timeout=10)
+                        await asyncio.to_thread(self.process.wait, 10)
                     except subprocess.TimeoutExpired:
                         self.process.kill()
-                        self.process.wait()
+                        await asyncio.to_thread(self.process.wait)
                 else:
                     # No subprocess object, find and kill the process using psutil
-                    try:
-                        import psutil
-                        work_dir = Path(self.config.working_directory)
-                        agent_config_path = work_dir / f"agent_{self.id}.yaml"
-                        
-                        # Search for cagent processes
-                        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                    pid = self._find_pid()
+                    if pid is not None:
+                        try:
+                            import psutil
+                            proc = psutil.Process(pid)
+                            logger.info(f"Terminating cagent process PID {pid}")
+                            proc.terminate()
                             try:
-                                if proc.info['name'] == 'cagent' and proc.info['cmdline']:
-                                    cmdline = ' '.join(proc.info['cmdline'])
-                                    if str(agent_config_path) in cmdline:
-                                        logger.info(f"Terminating cagent process PID {proc.info['pid']}")
-                                        proc.terminate()
-                                        try:
-                                            proc.wait(timeout=10)
-                                        except psutil.TimeoutExpired:
-                                            logger.warning(f"Process {proc.info['pid']} didn't terminate, killing")
-                                            proc.kill()
-                                            proc.wait()
-                                        break
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                continue
-                    except ImportError:
-                        logger.warning("psutil not available, cannot stop agent without process object")
+                                await asyncio.to_thread(proc.wait, 10)
+                            except psutil.TimeoutExpired:
+                                logger.warning(f"Process {pid} didn't terminate, killing")
+                                proc.kill()
+                                await asyncio.to_thread(proc.wait)
+                        except ImportError:
+                            logger.warning("psutil not available, cannot stop agent without process object")
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            pass
+                
+                pid_path = Path(self.config.working_directory) / f"agent_{self.id}.pid"
+                pid_path.unlink(missing_ok=True)
+                self._release_port()
                 
-                self.status = AgentStatus.STOPPED
+                self._transition("stop_completed")
                 self._emit("on_stop", self)
                 logger.info(f"Agent {self.name} stopped")
                 return True
@@ -328,68 +596,118 @@ class Agent:
     
     async def send_message(self, content: str) -> Optional[AgentMessage]:
         """Send a message to the agent and wait for response."""
+        chunks = [chunk async for chunk in self.stream_message(content)]
+        
+        # stream_message() records the reply in the history once it succeeds
+        last = self.message_history[-1] if self.message_history else None
+        if chunks and last is not None and last.role == "assistant":
+            return last
+        return None
+    
+    async def stream_message(self, content: str) -> AsyncIterator[str]:
+        """
+        Send a message to the agent, yielding the response as it is produced.
+        
+        The complete response is recorded in the message history and passed
+        to ``on_message`` callbacks once the agent finishes successfully.
+        """
         if self.status != AgentStatus.RUNNING:
             logger.error(f"Agent {self.name} is not running")
-            return None
+            return
+        
+        # Each message starts its own cagent run, so overlapping messages are
+        # turned away rather than queued behind a possibly long response
+        if self._invoke_lock.locked():
+            logger.error(f"Agent {self.name} is already handling a message")
+            return
+        
+        # aclosing() finishes the inner generator (and kills its cagent run)
+        # as soon as the caller stops iterating, rather than when it is
+        # garbage collected
+        async with self._invoke_lock, contextlib.aclosing(self._stream_message(content)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+    
+    async def _stream_message(self, content: str) -> AsyncIterator[str]:
+        """Run cagent for one message, yielding its output (see stream_message())."""
+        import tempfile
+        
+        # Record user message
+        user_msg = AgentMessage(role="user", content=content)
+        self.message_history.append(user_msg)
+        
+        # Get the temporary agent config path
+        agent_config_path = Path(tempfile.gettempdir()) / "debai" / f"agent_{self.id}.yaml"
+        
+        if not agent_config_path.exists():
+            logger.error(f"Agent config file not found: {agent_config_path}")
+            return
+        
+        # Run cagent with the message
+        cmd = [
+            "cagent", "run", str(agent_config_path), content, 
+            "--tui=false"
+        ]
         
+        process = None
+        stderr_reader: Optional[asyncio.Task] = None
         try:
-            import subprocess
-            import tempfile
-            
-            # Record user message
-            user_msg = AgentMessage(role="user", content=content)
-            self.message_history.append(user_msg)
-            
-            # Get the temporary agent config path
-            agent_config_path = Path(tempfile.gettempdir()) / "debai" / f"agent_{self.id}.yaml"
-            
-            if not agent_config_path.exists():
-                logger.error(f"Agent config file not found: {agent_config_path}")
-                return None
-            
-            # Run cagent with the message
-            cmd = [
-                "cagent", "run", str(agent_config_path), content, 
-                "--tui=false"
-            ]
-            
-            # Execute cagent run command
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                cwd=str(agent_config_path.parent)
+                cwd=str(agent_config_path.parent),
+                env=self._process_environment(),
             )
+            # Drain stderr alongside stdout so a chatty agent cannot fill the pipe
+            stderr_reader = asyncio.create_task(process.stderr.read())
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=120.0)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 120.0
+            parts: list[str] = []
             
-            if process.returncode == 0:
-                response_content = stdout.decode('utf-8').strip()
-                # Remove the "--- Agent: root ---" header if present
-                if response_content.startswith("--- Agent:"):
-                    lines = response_content.split('\n')
-                    if len(lines) > 1:
-                        response_content = '\n'.join(lines[1:]).strip()
+            while True:
+                line = await asyncio.wait_for(
+                    process.stdout.readline(), timeout=max(deadline - loop.time(), 0)
+                )
+                if not line:
+                    break
                 
-                if response_content:
-                    assistant_msg = AgentMessage(role="assistant", content=response_content)
-                    self.message_history.append(assistant_msg)
-                    self._emit("on_message", self, assistant_msg)
-                    return assistant_msg
-                else:
-                    logger.error(f"Empty response from agent {self.name}")
-                    return None
+                text = line.decode("utf-8", errors="replace")
+                # Skip leading blank lines and the "--- Agent: root ---" header
+                if not parts and (not text.strip() or text.startswith("--- Agent:")):
+                    continue
+                
+                parts.append(text)
+                yield text
+            
+            stderr = await asyncio.wait_for(
+                asyncio.shield(stderr_reader), timeout=max(deadline - loop.time(), 0)
+            )
+            await process.wait()
+            
+            if process.returncode != 0:
+                logger.error(f"Agent {self.name} error: {stderr.decode('utf-8')}")
+                return
+            
+            response_content = "".join(parts).strip()
+            if response_content:
+                assistant_msg = AgentMessage(role="assistant", content=response_content)
+                self.message_history.append(assistant_msg)
+                self._emit("on_message", self, assistant_msg)
             else:
-                error_text = stderr.decode('utf-8')
-                logger.error(f"Agent {self.name} error: {error_text}")
-                return None
+                logger.error(f"Empty response from agent {self.name}")
             
         except asyncio.TimeoutError:
             logger.error(f"Timeout waiting for response from agent {self.name}")
-            return None
         except Exception as e:
             logger.error(f"Error sending message to agent {self.name}: {e}")
-            return None
+        finally:
+            if stderr_reader is not None:
+                stderr_reader.cancel()
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
     
     async def execute_task(self, task_description: str) -> dict[str, Any]:
         """Execute a task and return the result."""
@@ -400,7 +718,7 @@ class Agent:
             "duration_seconds": 0,
         }
         
-        start_time = datetime.now()
+        start = time.perf_counter()
         
         try:
             response = await self.send_message(
@@ -416,27 +734,69 @@ class Agent:
             result["error"] = str(e)
             self._emit("on_error", self, e)
         
-        result["duration_seconds"] = (datetime.now() - start_time).total_seconds()
+        result["duration_seconds"] = time.perf_counter() - start
         return result
     
-    def _check_model_available(self, model_name: str) -> bool:
+    async def _check_model_available(self, model_name: str) -> bool:
         """Check if a model is available locally in docker-model."""
-        try:
-            result = subprocess.run(
-                ["docker-model", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                # Parse output and check if model exists
-                # Model name might be in format "dmr/model" or just "model"
-                check_name = model_name.replace("dmr/", "")
-                return check_name in result.stdout
-            return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            logger.warning("Could not check model availability (docker-model not found)")
-            return True  # Assume available if we can't check
+        # Model name might be in format "dmr/model" or just "model"
+        check_name = model_name.replace("dmr/", "")
+        if _model_listed(check_name, _available_models):
+            return True
+        
+        # Agents starting together share one listing instead of each running
+        # docker-model
+        lock = _available_models_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+        async with lock:
+            if _model_listed(check_name, _available_models):
+                return True
+            
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "docker-model", "list",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                logger.warning("Could not check model availability (docker-model not found)")
+                return True  # Assume available if we can't check
+            
+            try:
+                found = await asyncio.wait_for(
+                    self._scan_model_list(process, check_name), timeout=10
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Could not check model availability (docker-model timed out)")
+                return True
+            finally:
+                # Stop the listing once the model has been found (or on timeout
+                # or cancellation); the rest of the output is not needed. A
+                # listing that was already read to the end is left to exit by
+                # itself, as signalling it may race with asyncio reaping it
+                if process.returncode is None:
+                    if not process.stdout.at_eof():
+                        try:
+                            process.terminate()
+                        except ProcessLookupError:
+                            pass
+                    await process.wait()
+            
+            return found
+    
+    @staticmethod
+    async def _scan_model_list(process: asyncio.subprocess.Process, check_name: str) -> bool:
+        """Read ``docker-model list`` output until a row matches the model name."""
+        async for raw_line in process.stdout:
+            fields = raw_line.split(maxsplit=1)
+            # Skip blank lines and the "MODEL NAME ..." header
+            if not fields or fields[0] == b"MODEL":
+                continue
+            # The model name is the first column of each row
+            name = fields[0].decode(errors="replace")
+            _available_models.add(name)
+            if _model_listed(check_name, (name,)):
+                return True
+        return False
     
     def _pull_model(self, model_name: str) -> bool:
         """Pull a model using docker-model."""
@@ -465,8 +825,8 @@ class Agent:
             logger.error("docker-model command not found")
             return False
     
-    def _write_cagent_config(self, path: Path) -> None:
-        """Write cagent configuration file."""
+    def _write_cagent_config(self, path: Path) -> str:
+        """Write cagent configuration file and return the model ID it uses."""
         # cagent v2 format
         # Use the exact model requested by the user
         model_id = self.config.model_id
@@ -486,8 +846,10 @@ class Agent:
             }
         }
         
-        with open(path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+        # Left alone if unchanged since the agent's last start
+        write_yaml(path, config)
+        
+        return model_id
     
     def to_dict(self) -> dict[str, Any]:
         """Convert agent to dictionary."""
@@ -499,6 +861,13 @@ class Agent:
             "message_count": len(self.message_history),
         }
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize the agent's dictionary to JSON, using orjson if it is installed."""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+    
     def __repr__(self) -> str:
         return f"Agent(id={self.id}, name={self.name}, status={self.status.value})"
 
@@ -542,18 +911,20 @@ class AgentManager:
     ) -> list[Agent]:
         """List agents with optional filtering."""
         # Update all agent statuses first
-        for agent in self.agents.values():
-            agent.update_status()
-        
-        agents = list(self.agents.values())
-        
-        if status:
-            agents = [a for a in agents if a.status == status]
+        self._refresh_status_all()
         
-        if agent_type:
-            agents = [a for a in agents if a.config.agent_type == agent_type]
-        
-        return agents
+        # A single pass applies both filters
+        return [
+            a for a in self.agents.values()
+            if (not status or a.status == status)
+            and (not agent_type or a.config.agent_type == agent_type)
+        ]
+    
+    def _refresh_status_all(self) -> None:
+        """Update the status of every agent, scanning the process table at most once."""
+        scan = functools.lru_cache(maxsize=None)(_scan_cagent_processes)
+        for agent in self.agents.values():
+            agent.update_status(agent.is_alive(scan))
     
     async def start_agent(self, agent_id: str) -> bool:
         """Start an agent by ID."""
@@ -583,6 +954,7 @@ class AgentManager:
             config_path = self.config_dir / f"{agent_id}.yaml"
             if config_path.exists():
                 config_path.unlink()
+            cache_path_for(config_path).unlink(missing_ok=True)
             
             del self.agents[agent_id]
             logger.info(f"Deleted agent: {agent_id}")
@@ -590,35 +962,53 @@ class AgentManager:
     
     async def start_all(self, auto_start_only: bool = True) -> dict[str, bool]:
         """Start all agents (optionally only auto-start ones)."""
-        results = {}
-        for agent_id, agent in self.agents.items():
-            if not auto_start_only or agent.config.auto_start:
-                results[agent_id] = await agent.start()
-        return results
+        return await self._run_all(
+            "start",
+            [a for a in self.agents.values() if not auto_start_only or a.config.auto_start],
+        )
     
     async def stop_all(self) -> dict[str, bool]:
         """Stop all running agents."""
-        results = {}
-        for agent_id, agent in self.agents.items():
-            if agent.status == AgentStatus.RUNNING:
-                results[agent_id] = await agent.stop()
-        return results
+        return await self._run_all(
+            "stop",
+            [a for a in self.agents.values() if a.status == AgentStatus.RUNNING],
+        )
+    
+    async def _run_all(self, action: str, agents: list[Agent]) -> dict[str, bool]:
+        """Start or stop agents concurrently, reporting an exception as a failure."""
+        results = await asyncio.gather(
+            *(getattr(agent, action)() for agent in agents), return_exceptions=True,
+        )
+        
+        outcome = {}
+        for agent, result in zip(agents, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to {action} agent {agent.name}: {result}")
+                result = False
+            outcome[agent.id] = result
+        return outcome
     
     def load_agents(self) -> int:
         """Load agents from configuration directory."""
         count = 0
-        for config_file in self.config_dir.glob("*.yaml"):
-            try:
-                with open(config_file) as f:
-                    data = yaml.safe_load(f)
-                
-                config = AgentConfig(**data)
-                agent = Agent(config)
-                self.agents[config.id] = agent
-                count += 1
+        # scandir() gives the file type without a stat call, and keeps the
+        # stat that the parse cache is keyed by
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Failed to load agent from {config_file}: {e}")
+                config_file = Path(entry.path)
+                try:
+                    data = load_yaml_cached(config_file, entry.stat())
+                    
+                    config = AgentConfig.model_validate(data)
+                    agent = Agent(config)
+                    self.agents[config.id] = agent
+                    count += 1
+                    
+                except Exception as e:
+                    logger.error(f"Failed to load agent from {config_file}: {e}")
         
         logger.info(f"Loaded {count} agents from {self.config_dir}")
         return count
@@ -637,32 +1027,22 @@ class AgentManager:
     def _save_agent_config(self, agent: Agent) -> None:
         """Save agent configuration to file."""
         config_path = self.config_dir / f"{agent.id}.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump(agent.config.model_dump(), f, default_flow_style=False)
+        save_yaml_cached(config_path, agent.config.model_dump(mode="json"))
     
     def get_statistics(self) -> dict[str, Any]:
         """Get agent statistics."""
-        total = len(self.agents)
-        by_status = {}
-        by_type = {}
-        
-        for agent in self.agents.values():
-            status = agent.status.value
-            agent_type = agent.config.agent_type
-            
-            by_status[status] = by_status.get(status, 0) + 1
-            by_type[agent_type] = by_type.get(agent_type, 0) + 1
-        
+        agents = self.agents.values()
         return {
-            "total": total,
-            "by_status": by_status,
-            "by_type": by_type,
+            "total": len(self.agents),
+            "by_status": dict(Counter(a.status.value for a in agents)),
+            "by_type": dict(Counter(a.config.agent_type for a in agents)),
         }
 
 
-# Predefined agent templates
-AGENT_TEMPLATES = {
-    "package_updater": AgentConfig(
+# Predefined agent templates, as AgentConfig arguments. The configs are only
+# built when a template is first used, so importing this module stays cheap.
+_AGENT_TEMPLATE_SPECS: dict[str, dict[str, Any]] = {
+    "package_updater": dict(
         name="Package Updater",
         description="Automatically updates system packages",
         agent_type=AgentType.PACKAGE,
@@ -683,7 +1063,7 @@ Always prioritize security updates and be cautious with major version upgrades."
         allowed_commands=["apt", "apt-get", "dpkg", "snap", "flatpak"],
         schedule_cron="0 3 * * *",  # 3 AM daily
     ),
-    "config_manager": AgentConfig(
+    "config_manager": dict(
         name="Configuration Manager",
         description="Manages application configurations",
         agent_type=AgentType.CONFIG,
@@ -703,7 +1083,7 @@ Your role is to:
 
 Always create backups before modifying any configuration.""",
     ),
-    "resource_monitor": AgentConfig(
+    "resource_monitor": dict(
         name="Resource Monitor",
         description="Monitors and optimizes system resources",
         agent_type=AgentType.RESOURCE,
@@ -724,7 +1104,7 @@ Your role is to:
 Never terminate critical system processes without explicit permission.""",
         schedule_cron="*/15 * * * *",  # Every 15 minutes
     ),
-    "security_guard": AgentConfig(
+    "security_guard": dict(
         name="Security Guard",
         description="Monitors system security",
         agent_type=AgentType.SECURITY,
@@ -745,7 +1125,7 @@ Your role is to:
 Never expose sensitive information in logs or reports.""",
         interactive=True,
     ),
-    "backup_agent": AgentConfig(
+    "backup_agent": dict(
         name="Backup Manager",
         description="Manages system backups",
         agent_type=AgentType.BACKUP,
@@ -769,11 +1149,38 @@ Always verify backups after creation.""",
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _agent_templates() -> dict[str, AgentConfig]:
+    """Build the predefined agent templates, once per process."""
+    return {name: AgentConfig(**spec) for name, spec in _AGENT_TEMPLATE_SPECS.items()}
+
+
+def __getattr__(name: str) -> Any:
+    # AGENT_TEMPLATES is still available, built on first access
+    if name == "AGENT_TEMPLATES":
+        return _agent_templates()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_agent_template(template_name: str) -> Optional[AgentConfig]:
     """Get a predefined agent template."""
-    return AGENT_TEMPLATES.get(template_name)
+    template = _agent_templates().get(template_name)
+    if template:
+        # Return a copy so callers can customize it without changing the template
+        return template.model_copy(deep=True)
+    return None
 
 
 def list_agent_templates() -> list[str]:
     """List available agent templates."""
-    return list(AGENT_TEMPLATES.keys())
+    return list(_AGENT_TEMPLATE_SPECS.keys())
+
+
+def list_agent_templates_with_configs() -> list[tuple[str, AgentConfig]]:
+    """
+    List available agent templates together with their configurations.
+    
+    The configurations are shared and must not be modified; use
+    get_agent_template() to get one to customize.
+    """
+    return list(_agent_templates().items())
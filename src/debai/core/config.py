@@ -0,0 +1,169 @@
+"""
+Configuration file helpers for Debai.
+
+This module provides fast reading and writing of the YAML files that
+agents, models and tasks are stored in.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, Any, Optional
+
+import yaml
+
+try:
+    # libyaml bindings, included in PyYAML's binary wheels and Debian package
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+logger = logging.getLogger(__name__)
+
+# Keys marking timestamps in parse caches
+_DATETIME_TAG = "__debai_datetime__"
+_DATE_TAG = "__debai_date__"
+
+
+def dump_yaml(data: Any, stream: Optional[IO[str]] = None) -> Optional[str]:
+    """
+    Write plain data (as from ``model_dump(mode="json")``) to a YAML stream.
+    
+    Like ``yaml.dump()``, the YAML is returned as a string if no stream is
+    given.
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, default_flow_style=False)
+
+
+def write_yaml(path: Path, data: Any) -> bool:
+    """
+    Write plain data to a YAML file, unless the file already holds it.
+    
+    Returns whether the file was written. Comparing with the current
+    contents avoids rewriting (and re-syncing) configs that did not change.
+    """
+    payload = dump_yaml(data)
+    try:
+        if path.read_text() == payload:
+            return False
+    except (OSError, ValueError):
+        pass
+    
+    path.write_text(payload)
+    return True
+
+
+def cache_path_for(path: Path) -> Path:
+    """Get the path of the parse cache kept next to a YAML file."""
+    return path.with_name(f"{path.name}.json")
+
+
+def load_yaml_cached(path: Path, stat: Optional[os.stat_result] = None) -> Any:
+    """
+    Load a YAML file, reusing the previous parse if the file is unchanged.
+    
+    The parsed data is kept in memory and stored as JSON next to the file
+    together with the file's modification time and size, and only re-parsed
+    when either changes. The same object is returned for an unchanged file, so
+    callers must not modify it.
+    
+    ``stat`` may be passed if the caller already has it, e.g. from
+    ``os.DirEntry.stat()``.
+    """
+    if stat is None:
+        stat = path.stat()
+    return _load_yaml(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=512)
+def _load_yaml(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Load a YAML file through its JSON cache (see load_yaml_cached())."""
+    path = Path(path_str)
+    key = [mtime_ns, size]
+    cache_path = cache_path_for(path)
+    
+    # The cache is plain JSON, so a stray or damaged file can at worst be
+    # ignored; it is never able to run code
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f, object_hook=_decode_cache_value)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            return cached["data"]
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug(f"Ignoring unreadable cache {cache_path}: {e}")
+    
+    with open(path) as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    
+    _write_cache(cache_path, key, data)
+    return data
+
+
+def save_yaml_cached(path: Path, data: Any) -> None:
+    """
+    Write plain data to a YAML file along with its parse cache.
+    
+    Nothing is written if the file is unchanged. Otherwise, the next
+    load_yaml_cached() of the file reads the cache instead of parsing the
+    YAML just written.
+    """
+    if not write_yaml(path, data):
+        # Unchanged, so the existing cache (if any) is still valid
+        return
+    
+    stat = path.stat()
+    # Saved configs come from model_dump(mode="json"), which JSON stores as is
+    _write_cache(cache_path_for(path), [stat.st_mtime_ns, stat.st_size], data, check=False)
+
+
+def _write_cache(cache_path: Path, key: list[int], data: Any, check: bool = True) -> None:
+    """
+    Store parsed data as JSON together with the key of the file it came from.
+    
+    Unless ``check`` is false, the data is only cached if it reads back
+    from JSON unchanged.
+    """
+    try:
+        payload = json.dumps({"key": key, "data": data}, default=_encode_cache_value)
+    except (TypeError, ValueError):
+        return
+    # JSON turns tuples into lists and non-string keys into strings
+    if check and json.loads(payload, object_hook=_decode_cache_value)["data"] != data:
+        return
+    
+    # Write to a temporary file first so a concurrent reader never sees a
+    # partial cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _encode_cache_value(value: Any) -> Any:
+    """Encode the YAML timestamps that JSON has no type for."""
+    # datetime is a subclass of date, so it is checked first
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    raise TypeError(f"Can't cache {type(value).__name__} values")
+
+
+def _decode_cache_value(obj: dict[str, Any]) -> Any:
+    """Decode the values encoded by _encode_cache_value()."""
+    if len(obj) == 1:
+        if _DATETIME_TAG in obj:
+            return datetime.fromisoformat(obj[_DATETIME_TAG])
+        if _DATE_TAG in obj:
+            return date.fromisoformat(obj[_DATE_TAG])
+    return obj
@@ -8,21 +8,42 @@ using Docker Model Runner.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+import os
 import re
 import subprocess
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from debai.core.config import cache_path_for, load_yaml_cached, save_yaml_cached
+from debai.core.system import communicate_or_kill
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Docker Model Runner's OpenAI-compatible API. Its URL is read from
+# MODEL_RUNNER_HOST, as the docker model CLI does; the default is where Docker
+# Engine exposes the runner.
+_DEFAULT_MODEL_RUNNER_URL = "http://localhost:12434"
+_COMPLETIONS_PATH = "/engines/llama.cpp/v1/completions"
+_CHAT_COMPLETIONS_PATH = "/engines/llama.cpp/v1/chat/completions"
+
+# Separates docker's progress lines, including redraws of the same line
+_LINE_BREAK = re.compile(rb"[\r\n]")
+
+# Characters of model IDs (e.g. "ai/llama3.2:3b") replaced in config file names
+_CONFIG_NAME_TRANSLATION = str.maketrans({":": "_", "/": "_", "@": "_", "+": "_"})
+
 
 class ModelStatus(str, Enum):
     """Model status enumeration."""
@@ -83,8 +104,8 @@ class ModelConfig(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     tags: list[str] = Field(default_factory=list)
 
-    class Config:
-        use_enum_values = True
+    # Frozen so that a Model's cached dump of its config can't go stale
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 
 class Model:
@@ -98,6 +119,12 @@ class Model:
         self.config = config
         self.status = ModelStatus.NOT_PULLED
         self._lock = asyncio.Lock()
+        # HTTP session for inference, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Config the cached dump below was made from
+        self._dumped_config: Optional[ModelConfig] = None
+        self._config_dump: dict[str, Any] = {}
     
     @property
     def id(self) -> str:
@@ -112,7 +139,11 @@ class Model:
         return self.status in (ModelStatus.READY, ModelStatus.LOADED)
     
     async def pull(self, progress_callback: Optional[callable] = None) -> bool:
-        """Pull the model from Docker Model Runner."""
+        """Pull the model from Docker Model Runner.
+        
+        If given, ``progress_callback`` is called with each progress line
+        docker prints while the pull runs.
+        """
         async with self._lock:
             if self.status == ModelStatus.READY:
                 return True
@@ -121,14 +152,22 @@ class Model:
                 self.status = ModelStatus.PULLING
                 logger.info(f"Pulling model {self.id}...")
                 
-                # Use docker model pull
+                # Use docker model pull. Its progress output is only read when
+                # there is a callback for it; otherwise it is discarded rather
+                # than held in memory until the pull ends.
+                stdout = asyncio.subprocess.DEVNULL
+                if progress_callback:
+                    stdout = asyncio.subprocess.PIPE
                 process = await asyncio.create_subprocess_exec(
                     "docker", "model", "pull", self.id,
-                    stdout=asyncio.subprocess.PIPE,
+                    stdout=stdout,
                     stderr=asyncio.subprocess.PIPE,
                 )
                 
-                stdout, stderr = await process.communicate()
+                if progress_callback:
+                    stderr = await self._report_progress(process, progress_callback)
+                else:
+                    _, stderr = await communicate_or_kill(process)
                 
                 if process.returncode == 0:
                     self.status = ModelStatus.READY
@@ -144,6 +183,33 @@ class Model:
                 logger.error(f"Error pulling model {self.id}: {e}")
                 return False
     
+    @staticmethod
+    async def _report_progress(
+        process: asyncio.subprocess.Process,
+        progress_callback: callable,
+    ) -> bytes:
+        """Pass docker's progress lines to a callback until it exits, returning stderr."""
+        # Read stderr alongside so a chatty child can't block on a full pipe
+        stderr_reader = asyncio.ensure_future(process.stderr.read())
+        try:
+            pending = b""
+            while chunk := await process.stdout.read(4096):
+                # Progress bars redraw the same line with carriage returns
+                *lines, pending = _LINE_BREAK.split(pending + chunk)
+                for line in lines:
+                    if line.strip():
+                        progress_callback(line.decode(errors="replace").strip())
+            if pending.strip():
+                progress_callback(pending.decode(errors="replace").strip())
+            await process.wait()
+            return await stderr_reader
+        except asyncio.CancelledError:
+            stderr_reader.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+    
     async def load(self) -> bool:
         """Load the model into memory."""
         if self.status not in (ModelStatus.READY, ModelStatus.LOADED):
@@ -183,30 +249,19 @@ class Model:
             raise RuntimeError(f"Model {self.id} is not ready")
         
         try:
-            # Build generation request
-            cmd = [
-                "docker", "model", "run", self.id,
-                "--prompt", prompt,
-                "--max-tokens", str(max_tokens),
-                "--temperature", str(temperature or self.config.temperature),
-            ]
-            
+            body = {
+                "model": self.id,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "temperature": temperature or self.config.temperature,
+            }
             if stop_sequences:
-                for seq in stop_sequences:
-                    cmd.extend(["--stop", seq])
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            
-            stdout, stderr = await process.communicate()
+                body["stop"] = stop_sequences
             
-            if process.returncode == 0:
-                return stdout.decode().strip()
-            else:
-                raise RuntimeError(f"Generation failed: {stderr.decode()}")
+            result = await self._post(_COMPLETIONS_PATH, body)
+            if result is not None:
+                return result["choices"][0]["text"].strip()
+            return await self._generate_cli(prompt, max_tokens, temperature, stop_sequences)
                 
         except Exception as e:
             logger.error(f"Error generating text: {e}")
@@ -222,6 +277,20 @@ class Model:
         if not self.is_ready:
             raise RuntimeError(f"Model {self.id} is not ready")
         
+        body = {
+            "model": self.id,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature or self.config.temperature,
+        }
+        try:
+            result = await self._post(_CHAT_COMPLETIONS_PATH, body)
+        except Exception as e:
+            logger.error(f"Error generating text: {e}")
+            raise
+        if result is not None:
+            return result["choices"][0]["message"]["content"].strip()
+        
         # Format messages for chat
         formatted = []
         for msg in messages:
@@ -230,7 +299,113 @@ class Model:
             formatted.append(f"{role}: {content}")
         
         prompt = "\n".join(formatted) + "\nassistant:"
-        return await self.generate(prompt, max_tokens, temperature)
+        return await self._generate_cli(prompt, max_tokens, temperature)
+    
+    async def _post(self, path: str, body: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        Send a request to Docker Model Runner's OpenAI-compatible API.
+        
+        Returns None if the API can't be reached, e.g. because the runner's
+        TCP port is not enabled, or rejects the request with a 4xx status.
+        """
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        # The session keeps connections to the runner open between requests.
+        # It belongs to the event loop it was made on, and the GUI runs each
+        # action on a new loop.
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            await self._close_session()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64),
+                timeout=aiohttp.ClientTimeout(total=300),
+            )
+            self._session_loop = loop
+        
+        # Read on each request, like the docker CLI, so a changed host applies
+        url = os.environ.get("MODEL_RUNNER_HOST", _DEFAULT_MODEL_RUNNER_URL).rstrip("/") + path
+        try:
+            async with self._session.post(url, json=body) as response:
+                if 400 <= response.status < 500:
+                    # e.g. an older runner without this endpoint; the CLI
+                    # reports the actual problem if there is one
+                    logger.debug(
+                        f"Model Runner API returned {response.status}, using docker CLI"
+                    )
+                    return None
+                if response.status != 200:
+                    raise RuntimeError(f"Generation failed: {await response.text()}")
+                return await response.json()
+        except aiohttp.ClientConnectorError as e:
+            logger.debug(f"Model Runner API not reachable, using docker CLI: {e}")
+            return None
+    
+    async def _generate_cli(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        stop_sequences: Optional[list[str]] = None,
+    ) -> str:
+        """Generate text by running the model through the docker CLI."""
+        # Build generation request
+        cmd = [
+            "docker", "model", "run", self.id,
+            "--prompt", prompt,
+            "--max-tokens", str(max_tokens),
+            "--temperature", str(temperature or self.config.temperature),
+        ]
+        
+        if stop_sequences:
+            for seq in stop_sequences:
+                cmd.extend(["--stop", seq])
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        
+        stdout, stderr = await process.communicate()
+        
+        if process.returncode == 0:
+            return stdout.decode().strip()
+        else:
+            raise RuntimeError(f"Generation failed: {stderr.decode()}")
+    
+    async def close(self) -> None:
+        """Close the model's connections to the Model Runner API."""
+        await self._close_session()
+    
+    async def _close_session(self) -> None:
+        """Close the Model Runner API session, from any event loop."""
+        session, session_loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+        
+        if session_loop.is_running() and session_loop is not asyncio.get_running_loop():
+            # The session's loop runs in another thread; close it there
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            )
+        else:
+            # If its loop is already closed, this only marks the session
+            # closed; its connections are released when garbage collected
+            await session.close()
+    
+    def config_data(self) -> dict[str, Any]:
+        """
+        Get the model's config as plain (JSON-compatible) data.
+        
+        The config is frozen, so it is only dumped again after being
+        replaced. The returned dict is shared and must not be modified.
+        """
+        if self._dumped_config is not self.config:
+            self._config_dump = self.config.model_dump(mode="json")
+            self._dumped_config = self.config
+        return self._config_dump
     
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
@@ -266,13 +441,14 @@ class ModelManager:
             process = await asyncio.create_subprocess_exec(
                 "docker", "model", "list", "--format", "json",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             
-            stdout, stderr = await process.communicate()
+            stdout, _ = await communicate_or_kill(process)
             
             if process.returncode == 0:
-                data = json.loads(stdout.decode())
+                # json accepts the bytes as they are, without a decoded copy
+                data = json.loads(stdout)
                 for item in data:
                     config = ModelConfig(
                         id=item.get("name", item.get("id", "")),
@@ -311,18 +487,12 @@ class ModelManager:
         capability: Optional[ModelCapability] = None,
     ) -> list[Model]:
         """List models with optional filtering."""
-        models = list(self.models.values())
-        
-        if status:
-            models = [m for m in models if m.status == status]
-        
-        if capability:
-            models = [
-                m for m in models 
-                if capability in m.config.capabilities
-            ]
-        
-        return models
+        # A single pass applies both filters
+        return [
+            m for m in self.models.values()
+            if (not status or m.status == status)
+            and (not capability or capability in m.config.capabilities)
+        ]
     
     async def pull_model(
         self,
@@ -355,9 +525,10 @@ class ModelManager:
                 logger.warning(f"Error removing model from runner: {e}")
             
             # Remove configuration
-            config_path = self.config_dir / f"{model_id.replace(':', '_')}.yaml"
+            config_path = self._config_path(model_id)
             if config_path.exists():
                 config_path.unlink()
+            cache_path_for(config_path).unlink(missing_ok=True)
             
             del self.models[model_id]
             logger.info(f"Removed model: {model_id}")
@@ -366,19 +537,24 @@ class ModelManager:
     def load_models(self) -> int:
         """Load models from configuration directory."""
         count = 0
-        for config_file in self.config_dir.glob("*.yaml"):
-            try:
-                with open(config_file) as f:
-                    data = yaml.safe_load(f)
+        # Unchanged files are read from their parse cache, as for agents
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
                 
-                config = ModelConfig(**data)
-                model = Model(config)
-                model.status = ModelStatus.READY  # Assume ready if configured
-                self.models[config.id] = model
-                count += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to load model from {config_file}: {e}")
+                config_file = Path(entry.path)
+                try:
+                    data = load_yaml_cached(config_file, entry.stat())
+                    
+                    config = ModelConfig.model_validate(data)
+                    model = Model(config)
+                    model.status = ModelStatus.READY  # Assume ready if configured
+                    self.models[config.id] = model
+                    count += 1
+                    
+                except Exception as e:
+                    logger.error(f"Failed to load model from {config_file}: {e}")
         
         logger.info(f"Loaded {count} models from {self.config_dir}")
         return count
@@ -394,34 +570,38 @@ class ModelManager:
                 logger.error(f"Failed to save model {model.id}: {e}")
         return count
     
+    def _config_path(self, model_id: str) -> Path:
+        """Get the path of a model's configuration file."""
+        return self.config_dir / f"{model_id.translate(_CONFIG_NAME_TRANSLATION)}.yaml"
+    
     def _save_model_config(self, model: Model) -> None:
         """Save model configuration to file."""
-        config_path = self.config_dir / f"{model.id.replace(':', '_')}.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump(model.config.model_dump(), f, default_flow_style=False)
+        config_path = self._config_path(model.id)
+        # JSON mode dumps enums as their values, which the safe loader can read
+        save_yaml_cached(config_path, model.config_data())
+    
+    async def close(self) -> None:
+        """Close all models' connections to the Model Runner API."""
+        await asyncio.gather(*(model.close() for model in self.models.values()))
     
     def get_statistics(self) -> dict[str, Any]:
         """Get model statistics."""
-        total = len(self.models)
-        by_status = {}
-        total_size = 0
-        
-        for model in self.models.values():
-            status = model.status.value
-            by_status[status] = by_status.get(status, 0) + 1
-            total_size += model.config.size_bytes
+        models = self.models.values()
+        total_size = sum(m.config.size_bytes for m in models)
         
         return {
-            "total": total,
-            "by_status": by_status,
+            "total": len(self.models),
+            "by_status": dict(Counter(m.status.value for m in models)),
             "total_size_bytes": total_size,
             "total_size_gb": round(total_size / (1024**3), 2),
         }
 
 
-# Recommended models for different use cases
-RECOMMENDED_MODELS = {
-    "general": ModelConfig(
+# Recommended models for different use cases, as ModelConfig arguments. The
+# configs are only built when first needed, so importing this module stays
+# cheap.
+_RECOMMENDED_MODEL_SPECS: dict[str, dict[str, Any]] = {
+    "general": dict(
         id="llama3.2:3b",
         name="Llama 3.2 3B",
         description="Balanced model for general tasks",
@@ -433,7 +613,7 @@ RECOMMENDED_MODELS = {
             ModelCapability.CODE_GENERATION,
         ],
     ),
-    "code": ModelConfig(
+    "code": dict(
         id="codellama:7b",
         name="Code Llama 7B",
         description="Specialized for code generation and analysis",
@@ -444,7 +624,7 @@ RECOMMENDED_MODELS = {
             ModelCapability.TEXT_GENERATION,
         ],
     ),
-    "small": ModelConfig(
+    "small": dict(
         id="llama3.2:1b",
         name="Llama 3.2 1B",
         description="Lightweight model for simple tasks",
@@ -455,7 +635,7 @@ RECOMMENDED_MODELS = {
             ModelCapability.CHAT,
         ],
     ),
-    "large": ModelConfig(
+    "large": dict(
         id="llama3.1:8b",
         name="Llama 3.1 8B",
         description="Larger model for complex tasks",
@@ -471,11 +651,34 @@ RECOMMENDED_MODELS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _recommended_models() -> dict[str, ModelConfig]:
+    """Build the recommended model configs, once per process."""
+    return {name: ModelConfig(**spec) for name, spec in _RECOMMENDED_MODEL_SPECS.items()}
+
+
+def __getattr__(name: str) -> Any:
+    # RECOMMENDED_MODELS is still available, built on first access
+    if name == "RECOMMENDED_MODELS":
+        return _recommended_models()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_recommended_model(use_case: str) -> Optional[ModelConfig]:
-    """Get a recommended model for a specific use case."""
-    return RECOMMENDED_MODELS.get(use_case)
+    """
+    Get a recommended model for a specific use case.
+    
+    The config is shared between callers; being frozen, it can't be changed
+    by accident. Use ``model_copy(update=...)`` to derive a customized one.
+    """
+    return _recommended_models().get(use_case)
 
 
 def list_recommended_models() -> list[str]:
     """List available recommended model configurations."""
-    return list(RECOMMENDED_MODELS.keys())
+    return list(_RECOMMENDED_MODEL_SPECS.keys())
+
+
+def list_recommended_models_with_configs() -> list[tuple[str, ModelConfig]]:
+    """List available use cases together with their recommended model configurations."""
+    return list(_recommended_models().items())
@@ -11,6 +11,7 @@ import asyncio
 import logging
 import os
 import platform
+import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
@@ -140,8 +141,13 @@ class SystemInfo:
         return info
     
     @staticmethod
-    def get_cpu_info() -> CPUInfo:
-        """Get CPU information."""
+    def get_cpu_info(interval: Optional[float] = 0.1) -> CPUInfo:
+        """Get CPU information.
+        
+        ``interval`` is passed to psutil.cpu_percent(). With None the usage is
+        measured since the previous call instead of blocking, which suits
+        callers that poll periodically.
+        """
         freq = psutil.cpu_freq()
         
         # Get CPU model
@@ -172,7 +178,7 @@ class SystemInfo:
             cores_physical=psutil.cpu_count(logical=False) or 1,
             cores_logical=psutil.cpu_count(logical=True) or 1,
             frequency_mhz=freq.current if freq else 0,
-            usage_percent=psutil.cpu_percent(interval=0.1),
+            usage_percent=psutil.cpu_percent(interval=interval),
             temperature=temp,
         )
     
@@ -286,13 +292,16 @@ class SystemInfo:
         return users
     
     @staticmethod
-    def get_summary() -> dict[str, Any]:
-        """Get a summary of system information."""
+    def get_summary(interval: Optional[float] = 0.1) -> dict[str, Any]:
+        """Get a summary of system information.
+        
+        ``interval`` is the CPU usage sampling interval, see get_cpu_info().
+        """
         return {
             "hostname": SystemInfo.get_hostname(),
             "os": SystemInfo.get_os_info(),
             "distro": SystemInfo.get_distro_info(),
-            "cpu": SystemInfo.get_cpu_info().__dict__,
+            "cpu": SystemInfo.get_cpu_info(interval).__dict__,
             "memory": SystemInfo.get_memory_info().__dict__,
             "uptime": SystemInfo.get_uptime_string(),
             "load_average": SystemInfo.get_load_average(),
@@ -315,6 +324,9 @@ class ResourceMonitor:
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._callbacks: list[callable] = []
+        # CPU times at the previous snapshot; kept per monitor so other
+        # psutil.cpu_percent() callers don't move the baseline
+        self._cpu_times: Optional[Any] = None
         
         # Thresholds
         self.thresholds = {
@@ -355,6 +367,12 @@ class ResourceMonitor:
     
     async def _monitor_loop(self) -> None:
         """Main monitoring loop."""
+        # Measure the first snapshot's CPU usage over a short window, without
+        # blocking the event loop; right after priming, the delta would be
+        # near zero
+        self._cpu_times = psutil.cpu_times()
+        await asyncio.sleep(0.1)
+        
         while self._running:
             try:
                 snapshot = self._take_snapshot()
@@ -376,9 +394,32 @@ class ResourceMonitor:
                 logger.error(f"Error in monitor loop: {e}")
                 await asyncio.sleep(1)
     
+    def _cpu_percent(self) -> float:
+        """
+        CPU usage since the previous snapshot, i.e. averaged over the monitor
+        interval, without blocking the event loop to sample it.
+        """
+        previous, current = self._cpu_times, psutil.cpu_times()
+        self._cpu_times = current
+        if previous is None:
+            return 0.0
+        
+        def busy_and_total(times: Any) -> tuple[float, float]:
+            # Guest time is already counted in user and nice on Linux
+            total = sum(times) - getattr(times, "guest", 0) - getattr(times, "guest_nice", 0)
+            idle = times.idle + getattr(times, "iowait", 0)
+            return total - idle, total
+        
+        busy_before, total_before = busy_and_total(previous)
+        busy_now, total_now = busy_and_total(current)
+        if total_now <= total_before:
+            return 0.0
+        percent = (busy_now - busy_before) / (total_now - total_before) * 100
+        return round(min(max(percent, 0.0), 100.0), 1)
+    
     def _take_snapshot(self) -> dict[str, Any]:
         """Take a resource snapshot."""
-        cpu = psutil.cpu_percent(interval=0.1)
+        cpu = self._cpu_percent()
         mem = psutil.virtual_memory()
         load = os.getloadavg()
         
@@ -518,8 +559,29 @@ def format_bytes(size: int) -> str:
     return f"{size:.1f} PB"
 
 
-def get_docker_status() -> dict[str, Any]:
-    """Get Docker status."""
+async def communicate_or_kill(
+    process: asyncio.subprocess.Process,
+) -> tuple[bytes, bytes]:
+    """Wait for a subprocess like communicate(), killing it if the caller is cancelled.
+    
+    Without this, cancelling a command (e.g. on Ctrl+C) leaves the child
+    running after Debai exits.
+    """
+    try:
+        return await process.communicate()
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+
+def get_docker_status(timeout: Optional[float] = None) -> dict[str, Any]:
+    """Get Docker status.
+    
+    ``timeout`` bounds each docker probe, so an unresponsive daemon is
+    reported as not running instead of blocking the caller.
+    """
     result = {
         "installed": False,
         "running": False,
@@ -534,6 +596,7 @@ def get_docker_status() -> dict[str, Any]:
             ["docker", "--version"],
             capture_output=True,
             text=True,
+            timeout=timeout,
         )
         if version.returncode == 0:
             result["installed"] = True
@@ -544,6 +607,7 @@ def get_docker_status() -> dict[str, Any]:
             ["docker", "info", "--format", "{{json .}}"],
             capture_output=True,
             text=True,
+            timeout=timeout,
         )
         if info.returncode == 0:
             result["running"] = True
@@ -584,17 +648,10 @@ def check_dependencies() -> dict[str, bool]:
             search_paths.append(Path(path_entry))
     
     for dep in deps:
-        # Try which first
-        try:
-            result = subprocess.run(
-                ["which", dep],
-                capture_output=True,
-            )
-            if result.returncode == 0:
-                deps[dep] = True
-                continue
-        except Exception:
-            pass
+        # Look it up on PATH first, without spawning `which` for every binary
+        if shutil.which(dep):
+            deps[dep] = True
+            continue
         
         # Manual search in common locations
         for search_path in search_paths:
@@ -10,17 +10,22 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 import yaml
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Maximum length of a single output line read by Task.stream()
+STREAM_LINE_LIMIT = 1024 * 1024
+
 
 class TaskStatus(str, Enum):
     """Task status enumeration."""
@@ -33,6 +38,8 @@ class TaskStatus(str, Enum):
     PAUSED = "paused"
 
 
+# The CLI spells these values out in TASK_PRIORITY_CHOICES (debai.cli.commands.task)
+# so it doesn't import this module at startup; update both together.
 class TaskPriority(str, Enum):
     """Task priority levels."""
     LOW = "low"
@@ -218,6 +225,129 @@ class Task:
                 self.history.append(task_result)
                 return task_result
     
+    async def stream(self, tail_lines: int = 200) -> AsyncIterator[tuple[str, bytes]]:
+        """
+        Execute the task, yielding output lines as they are produced.
+        
+        Yields ``("stdout", line)`` and ``("stderr", line)`` tuples. Only the
+        last ``tail_lines`` lines of each stream are kept in the resulting
+        TaskResult, which is available as ``last_result`` once iteration
+        finishes. Unlike execute(), failed runs are not retried.
+        """
+        if self.config.task_type == TaskType.AGENT:
+            result = await self.execute()
+            if result.stdout:
+                yield ("stdout", result.stdout.encode())
+            return
+        
+        async with self._lock:
+            started_at = datetime.now()
+            self.status = TaskStatus.RUNNING
+            self._emit("on_start", self)
+            
+            tails = {
+                "stdout": deque(maxlen=tail_lines),
+                "stderr": deque(maxlen=tail_lines),
+            }
+            exit_code = -1
+            error_message = None
+            readers: list[asyncio.Task] = []
+            
+            try:
+                if self.config.task_type == TaskType.SCRIPT:
+                    command = self._script_command()
+                    if command is None:
+                        raise FileNotFoundError(f"Script not found: {self.config.script_path}")
+                else:
+                    command = self.config.command
+                
+                self._process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.config.working_directory,
+                    env={**os.environ, **self.config.environment},
+                    limit=STREAM_LINE_LIMIT,
+                )
+                
+                queue: asyncio.Queue[tuple[str, Optional[bytes]]] = asyncio.Queue()
+                
+                async def pump(name: str, reader: asyncio.StreamReader) -> None:
+                    try:
+                        async for line in reader:
+                            tails[name].append(line)
+                            await queue.put((name, line))
+                    finally:
+                        await queue.put((name, None))
+                
+                readers = [
+                    asyncio.create_task(pump("stdout", self._process.stdout)),
+                    asyncio.create_task(pump("stderr", self._process.stderr)),
+                ]
+                
+                deadline = asyncio.get_running_loop().time() + self.config.timeout_seconds
+                open_streams = len(readers)
+                while open_streams:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    name, line = await asyncio.wait_for(queue.get(), timeout=max(remaining, 0))
+                    if line is None:
+                        open_streams -= 1
+                    else:
+                        yield (name, line)
+                
+                exit_code = await asyncio.wait_for(
+                    self._process.wait(),
+                    timeout=max(deadline - asyncio.get_running_loop().time(), 0),
+                )
+                
+            except asyncio.TimeoutError:
+                error_message = "Task timed out"
+                tails["stderr"].append(b"Task timed out\n")
+            except (GeneratorExit, asyncio.CancelledError):
+                # The consumer stopped iterating before the command finished
+                self.status = TaskStatus.CANCELLED
+                raise
+            except Exception as e:
+                error_message = str(e)
+                tails["stderr"].append(f"{e}\n".encode())
+            finally:
+                for reader in readers:
+                    reader.cancel()
+                pump_results = await asyncio.gather(*readers, return_exceptions=True)
+                if self._process and self._process.returncode is None:
+                    self._process.kill()
+                    await self._process.wait()
+            
+            # A reader fails on a line longer than STREAM_LINE_LIMIT
+            for pump_result in pump_results:
+                if isinstance(pump_result, Exception) and error_message is None:
+                    error_message = f"Output read failed: {pump_result}"
+                    tails["stderr"].append(f"{error_message}\n".encode())
+            
+            completed_at = datetime.now()
+            task_result = TaskResult(
+                task_id=self.id,
+                success=exit_code == 0 and error_message is None,
+                exit_code=exit_code,
+                stdout=b"".join(tails["stdout"]).decode(errors="replace"),
+                stderr=b"".join(tails["stderr"]).decode(errors="replace"),
+                started_at=started_at,
+                completed_at=completed_at,
+                duration_seconds=(completed_at - started_at).total_seconds(),
+                retry_count=self.current_retry,
+                error_message=error_message,
+            )
+            
+            if task_result.success:
+                self.status = TaskStatus.COMPLETED
+                self._emit("on_complete", self, task_result)
+            else:
+                self.status = TaskStatus.FAILED
+                self._emit("on_failure", self, task_result)
+            
+            self.last_result = task_result
+            self.history.append(task_result)
+    
     async def _execute_command(self) -> dict[str, Any]:
         """Execute a shell command."""
         try:
@@ -263,26 +393,31 @@ class Task:
     
     async def _execute_script(self) -> dict[str, Any]:
         """Execute a script file."""
-        script_path = Path(self.config.script_path)
-        if not script_path.exists():
+        command = self._script_command()
+        if command is None:
             return {
                 "success": False,
                 "exit_code": -1,
-                "stderr": f"Script not found: {script_path}",
+                "stderr": f"Script not found: {self.config.script_path}",
             }
         
+        self.config.command = command
+        return await self._execute_command()
+    
+    def _script_command(self) -> Optional[str]:
+        """Build the shell command that runs the task script, if it exists."""
+        script_path = Path(self.config.script_path)
+        if not script_path.exists():
+            return None
+        
         # Determine interpreter
         with open(script_path) as f:
             first_line = f.readline()
         
         if first_line.startswith("#!"):
             interpreter = first_line[2:].strip()
-            command = f"{interpreter} {script_path}"
-        else:
-            command = f"bash {script_path}"
-        
-        self.config.command = command
-        return await self._execute_command()
+            return f"{interpreter} {script_path}"
+        return f"bash {script_path}"
     
     async def _execute_agent(self) -> dict[str, Any]:
         """Execute task via an agent."""
@@ -573,3 +708,13 @@ def get_task_template(template_name: str) -> Optional[TaskConfig]:
 def list_task_templates() -> list[str]:
     """List available task templates."""
     return list(TASK_TEMPLATES.keys())
+
+
+def list_task_templates_with_configs() -> list[tuple[str, TaskConfig]]:
+    """
+    List available task templates together with their configurations.
+    
+    The configurations are shared and must not be modified; use
+    get_task_template() to get one to customize.
+    """
+    return list(TASK_TEMPLATES.items())
@@ -7,8 +7,9 @@ Generates Docker Compose configurations for running Debai in containers.
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import yaml
 
@@ -24,13 +25,13 @@ class ComposeGenerator:
     
     def __init__(
         self,
-        output_path: Path,
+        output_path: Union[str, os.PathLike],
         include_gui: bool = True,
         include_monitoring: bool = True,
         include_models: bool = True,
         model_ids: Optional[list[str]] = None,
     ):
-        self.output_path = output_path
+        self.output_path = Path(output_path)
         self.include_gui = include_gui
         self.include_monitoring = include_monitoring
         self.include_models = include_models
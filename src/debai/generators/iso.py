@@ -13,11 +13,13 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import yaml
 from jinja2 import Template
 
+from debai.core.system import communicate_or_kill
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,14 +32,14 @@ class ISOGenerator:
     
     def __init__(
         self,
-        output_path: Path,
+        output_path: Union[str, os.PathLike],
         base_distro: str = "debian",
         release: str = "trixie",
         arch: str = "amd64",
         include_agents: bool = True,
         include_gui: bool = True,
     ):
-        self.output_path = output_path
+        self.output_path = Path(output_path)
         self.base_distro = base_distro
         self.release = release
         self.arch = arch
@@ -251,12 +253,12 @@ WantedBy=multi-user.target
     
     async def _add_default_agents(self, iso_root: Path) -> None:
         """Add default agent configurations."""
-        from debai.core.agent import AGENT_TEMPLATES
+        from debai.core.agent import list_agent_templates_with_configs
         
         agents_dir = iso_root / "etc" / "debai" / "agents"
         agents_dir.mkdir(parents=True, exist_ok=True)
         
-        for name, config in AGENT_TEMPLATES.items():
+        for name, config in list_agent_templates_with_configs():
             config_path = agents_dir / f"{name}.yaml"
             config_path.write_text(yaml.dump(config.model_dump(), default_flow_style=False))
     
@@ -311,7 +313,7 @@ WantedBy=multi-user.target
             stderr=asyncio.subprocess.PIPE,
         )
         
-        stdout, stderr = await process.communicate()
+        stdout, stderr = await communicate_or_kill(process)
         
         if process.returncode != 0:
             raise RuntimeError(f"ISO generation failed: {stderr.decode()}")
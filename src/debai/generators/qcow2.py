@@ -13,10 +13,12 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import yaml
 
+from debai.core.system import communicate_or_kill
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,7 +31,7 @@ class QCOW2Generator:
     
     def __init__(
         self,
-        output_path: Path,
+        output_path: Union[str, os.PathLike],
         disk_size: str = "20G",
         base_distro: str = "debian",
         release: str = "trixie",
@@ -37,7 +39,7 @@ class QCOW2Generator:
         memory_mb: int = 2048,
         cpus: int = 2,
     ):
-        self.output_path = output_path
+        self.output_path = Path(output_path)
         self.disk_size = disk_size
         self.base_distro = base_distro
         self.release = release
@@ -102,7 +104,7 @@ class QCOW2Generator:
             stderr=asyncio.subprocess.PIPE,
         )
         
-        stdout, stderr = await process.communicate()
+        stdout, stderr = await communicate_or_kill(process)
         
         if process.returncode != 0:
             raise RuntimeError(f"Failed to create QCOW2: {stderr.decode()}")
@@ -215,7 +217,7 @@ class QCOW2Generator:
             stderr=asyncio.subprocess.PIPE,
         )
         
-        stdout, stderr = await process.communicate()
+        stdout, stderr = await communicate_or_kill(process)
         
         if process.returncode == 0:
             logger.info(f"Created cloud-init ISO: {cloud_init_iso}")
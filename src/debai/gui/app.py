@@ -21,7 +21,10 @@ from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
 from debai import __version__
 from debai.core.agent import AgentManager, AgentConfig, AgentType, get_agent_template, list_agent_templates
-from debai.core.model import ModelManager, ModelConfig, get_recommended_model, list_recommended_models
+from debai.core.model import (
+    ModelManager, ModelConfig, get_recommended_model, list_recommended_models,
+    list_recommended_models_with_configs,
+)
 from debai.core.task import TaskManager, TaskConfig
 from debai.core.system import SystemInfo, ResourceMonitor, check_dependencies
 
@@ -70,6 +73,13 @@ class DebaiApplication(Adw.Application):
         # Apply CSS
         self._load_css()
     
+    def do_shutdown(self):
+        """Called when the application quits."""
+        # Each action's event loop is closed by now; this only releases the
+        # models' Model Runner API sessions
+        asyncio.run(self.model_manager.close())
+        Adw.Application.do_shutdown(self)
+    
     def _setup_actions(self):
         """Set up application actions."""
         actions = [
@@ -1076,7 +1086,7 @@ class DebaiWindow(Adw.ApplicationWindow):
     def _start_monitoring(self):
         """Start resource monitoring in background."""
         def update_metrics():
-            info = SystemInfo.get_cpu_info()
+            info = SystemInfo.get_cpu_info(interval=None)
             mem = SystemInfo.get_memory_info()
             
             # Update CPU
@@ -1498,7 +1508,7 @@ class NewAgentDialog(Adw.Window):
         
         # Get selected model
         model_idx = self.model_combo.get_selected()
-        models = [get_recommended_model(n).id for n in list_recommended_models() if get_recommended_model(n)]
+        models = [config.id for _, config in list_recommended_models_with_configs()]
         model_id = models[model_idx] if model_idx < len(models) else models[0] if models else "llama3.2:3b"
         
         # Create agent config